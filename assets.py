@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gestionnaire d'images partagé pour le jeu Boulange
+Décode chaque fichier une seule fois, le convertit au format de l'affichage
+et garde en cache les variantes redimensionnées (cache LRU borné en mémoire)
+
+Utilisable aussi en ligne de commande pour préparer les images réduites :
+    python -m assets build     (une image PNG réduite par taille affichée)
+    python -m assets pack      (un seul fichier binaire lu par mmap)
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pygame
+from traces import tracer
+
+DOSSIER_IMAGES = "images"
+DOSSIER_DERIVES = os.path.join(DOSSIER_IMAGES, "derives")
+FICHIER_MANIFESTE = "manifeste.json"
+FICHIER_PAQUET = os.path.join(DOSSIER_IMAGES, "assets.pack")
+
+# Format du paquet : en-tête, index, puis pixels bruts alignés sur 16 octets
+#   en-tête : magie (4s), version (H), nombre d'entrées (I)
+#   entrée  : longueur du nom (H), nom UTF-8, largeur (H), hauteur (H),
+#             format de pixels (4s : b"RGBA" ou b"RGBX"), décalage (Q), longueur (I),
+#             taille (Q) et mtime_ns (q) de l'image source au moment de l'empaquetage
+MAGIE_PAQUET = b"BLPK"
+VERSION_PAQUET = 2
+_EN_TETE = struct.Struct("<4sHI")
+_NOM = struct.Struct("<H")
+_ENTREE = struct.Struct("<HH4sQIQq")
+_ALIGNEMENT = 16
+
+# Tailles réellement affichées par les écrans (zone image des boutons = bouton - (20, 50))
+TAILLE_IMAGE_RECETTE = (180, 130)      # BoutonImage 200x180 de l'accueil
+TAILLE_IMAGE_INGREDIENT = (140, 80)    # BoutonImage 160x130 de la sélection
+TAILLE_IMAGE_RESULTAT = (250, 180)     # cadre produit de l'écran résultat
+
+
+def variantes_demarrage():
+    """
+    Liste des (chemin, taille) à précharger au lancement : images des recettes de
+    l'accueil et des ingrédients. Ne lit que les recettes affichées, pas tout le catalogue.
+    """
+    from recipes import RECETTES, RECETTES_ACCUEIL, TOUS_INGREDIENTS
+
+    variantes = [
+        (os.path.join(DOSSIER_IMAGES, RECETTES[nom]["images"]["base"]), TAILLE_IMAGE_RECETTE)
+        for nom in RECETTES_ACCUEIL
+    ]
+    for ingredient in TOUS_INGREDIENTS:
+        variantes.append((os.path.join(DOSSIER_IMAGES, f"{ingredient}.png"), TAILLE_IMAGE_INGREDIENT))
+    return variantes
+
+
+def variantes_recette(nom_recette):
+    """Images de résultat d'une recette (préchargées quand la recette est choisie)"""
+    from recipes import RECETTES
+
+    images = RECETTES[nom_recette]["images"]
+    return [
+        (os.path.join(DOSSIER_IMAGES, images[statut]), TAILLE_IMAGE_RESULTAT)
+        for statut in ("reussie", "cru", "brule")
+        if images.get(statut)
+    ]
+
+
+def variantes_requises():
+    """Liste des (chemin, taille) que les écrans peuvent demander, pour tout le catalogue (hors ligne)"""
+    from recipes import RECETTES, TOUS_INGREDIENTS
+
+    variantes = []
+    for nom, recette in RECETTES.items():
+        variantes.append((os.path.join(DOSSIER_IMAGES, recette["images"]["base"]), TAILLE_IMAGE_RECETTE))
+        variantes.extend(variantes_recette(nom))
+    for ingredient in TOUS_INGREDIENTS:
+        variantes.append((os.path.join(DOSSIER_IMAGES, f"{ingredient}.png"), TAILLE_IMAGE_INGREDIENT))
+    return variantes
+
+
+def _nom_variante(chemin, taille):
+    base, ext = os.path.splitext(os.path.basename(chemin))
+    return f"{base}_{taille[0]}x{taille[1]}{ext}"
+
+
+def _empreinte_fichier(chemin):
+    """Empreinte SHA-256 du contenu d'un fichier source"""
+    h = hashlib.sha256()
+    with open(chemin, "rb") as f:
+        for bloc in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloc)
+    return h.hexdigest()
+
+
+def _cle_paquet(chemin, taille):
+    return f"{os.path.normpath(chemin)}@{taille[0]}x{taille[1]}"
+
+
+class PaquetAssets:
+    """
+    Lecture d'un paquet d'images projeté en mémoire (mmap).
+    Les surfaces sont construites directement sur les octets projetés, sans copie.
+    """
+
+    def __init__(self, chemin=FICHIER_PAQUET):
+        self.chemin = chemin
+        self._fichier = open(chemin, "rb")
+        try:
+            self._carte = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # fichier vide
+            self._fichier.close()
+            raise
+        self._vue = memoryview(self._carte)
+        self.index = self._lire_index()
+
+    def _lire_index(self):
+        magie, version, nombre = _EN_TETE.unpack_from(self._carte, 0)
+        if magie != MAGIE_PAQUET or version != VERSION_PAQUET:
+            raise ValueError(f"{self.chemin} : paquet d'images invalide")
+        index = {}
+        pos = _EN_TETE.size
+        for _ in range(nombre):
+            (longueur_nom,) = _NOM.unpack_from(self._carte, pos)
+            pos += _NOM.size
+            nom = bytes(self._vue[pos:pos + longueur_nom]).decode("utf-8")
+            pos += longueur_nom
+            (largeur, hauteur, format_pixels, decalage, longueur,
+             octets_source, mtime_source) = _ENTREE.unpack_from(self._carte, pos)
+            pos += _ENTREE.size
+            index[nom] = ((largeur, hauteur), format_pixels.decode("ascii"), decalage, longueur,
+                          octets_source, mtime_source)
+        return index
+
+    def surface(self, chemin, taille):
+        """Surface pour (chemin, taille), ou None si le paquet ne la contient pas ou plus à jour"""
+        entree = self.index.get(_cle_paquet(chemin, taille))
+        if entree is None:
+            return None
+        dimensions, format_pixels, decalage, longueur, octets_source, mtime_source = entree
+        # Même vérification que pour les images pré-réduites : une source modifiée depuis
+        # l'empaquetage l'emporte, une source absente laisse l'entrée valable
+        try:
+            st = os.stat(chemin)
+        except OSError:
+            st = None
+        if st and (st.st_size != octets_source or st.st_mtime_ns != mtime_source):
+            return None
+        return pygame.image.frombuffer(self._vue[decalage:decalage + longueur], dimensions, format_pixels)
+
+    @classmethod
+    def ouvrir(cls, chemin=FICHIER_PAQUET):
+        """Ouvre le paquet s'il existe et est valide, sinon None"""
+        try:
+            return cls(chemin)
+        except (OSError, ValueError, struct.error):
+            return None
+
+
+class GestionnaireAssets:
+    """Cache LRU des images décodées, indexé par (chemin, taille)"""
+
+    def __init__(self, budget_octets=48 * 1024 * 1024, dossier_derives=DOSSIER_DERIVES,
+                 chemin_paquet=FICHIER_PAQUET):
+        self.budget_octets = budget_octets
+        self.dossier_derives = dossier_derives
+        self.chemin_paquet = chemin_paquet
+        self._paquet = None          # ouvert à la première demande
+        self._paquet_ouvert = False
+        self._manifeste = None       # chargé à la première demande
+        self.octets_utilises = 0
+        self.succes = 0
+        self.echecs = 0
+        self._cache = OrderedDict()  # (chemin, taille) -> Surface
+        self._introuvables = set()   # chemins absents ou illisibles
+        self._executeur = None       # fils de décodage du préchargeur
+        self._en_attente = {}        # (chemin, taille) -> Future d'une Surface non convertie
+
+    # --------------------------
+    # ACCÈS AUX IMAGES
+    # --------------------------
+
+    def obtenir_image(self, chemin, taille=None):
+        """
+        Retourne l'image `chemin` redimensionnée à `taille` (ou à sa taille d'origine).
+        Retourne None si le fichier est absent ou illisible.
+        """
+        cle = (chemin, tuple(taille) if taille else None)
+        image = self._cache.get(cle)
+        if image is not None:
+            self._cache.move_to_end(cle)
+            self.succes += 1
+            return image
+
+        self.echecs += 1
+        with tracer("charger_image", "assets", {"chemin": chemin, "taille": cle[1]}):
+            return self._charger(chemin, cle)
+
+    def _charger(self, chemin, cle):
+        """Cache manqué : paquet, préchargement en cours, image pré-réduite ou source"""
+        if cle[1] is not None:
+            image = self._depuis_paquet(chemin, cle[1])
+            if image is not None:
+                self._stocker(cle, image)
+                return image
+        futur = self._en_attente.pop(cle, None)
+        if futur is not None:
+            # Préchargement en cours : on attend juste cette image
+            image = self._integrer(chemin, futur)
+            if image is not None:
+                self._stocker(cle, image)
+            return image
+        if chemin in self._introuvables:
+            return None
+
+        if cle[1] is None:
+            image = self._decoder(chemin)
+        else:
+            image = self._charger_derive(chemin, cle[1])
+            if image is None:
+                originale = self._original(chemin)
+                image = pygame.transform.scale(originale, cle[1]) if originale else None
+
+        if image is None:
+            return None
+        self._stocker(cle, image)
+        return image
+
+    def _original(self, chemin):
+        """Retourne l'image d'origine, depuis le cache si possible (sans compter de succès/échec)"""
+        cle = (chemin, None)
+        image = self._cache.get(cle)
+        if image is not None:
+            self._cache.move_to_end(cle)
+            return image
+        image = self._decoder(chemin)
+        if image is not None:
+            self._stocker(cle, image)
+        return image
+
+    def _decoder(self, chemin):
+        """Décode le fichier et le convertit au format de pixels de l'écran"""
+        try:
+            if not os.path.exists(chemin):
+                raise FileNotFoundError(chemin)
+            image = pygame.image.load(chemin)
+        except (FileNotFoundError, pygame.error):
+            self._introuvables.add(chemin)
+            return None
+        return self._convertir(image)
+
+    # --------------------------
+    # PAQUET PROJETÉ EN MÉMOIRE (python -m assets pack)
+    # --------------------------
+
+    def _depuis_paquet(self, chemin, taille):
+        if not self._paquet_ouvert:
+            self._paquet_ouvert = True
+            self._paquet = PaquetAssets.ouvrir(self.chemin_paquet)
+        if self._paquet is None:
+            return None
+        return self._paquet.surface(chemin, taille)
+
+    # --------------------------
+    # IMAGES PRÉ-RÉDUITES (python -m assets build)
+    # --------------------------
+
+    def _charger_manifeste(self):
+        if self._manifeste is None:
+            chemin = os.path.join(self.dossier_derives, FICHIER_MANIFESTE)
+            try:
+                with open(chemin, encoding="utf-8") as f:
+                    self._manifeste = json.load(f)
+            except (OSError, ValueError):
+                self._manifeste = {}
+        return self._manifeste
+
+    def _chemin_derive(self, chemin, taille):
+        """Chemin de l'image pré-réduite si elle est à jour, sinon None"""
+        entree = self._charger_manifeste().get(os.path.normpath(chemin))
+        if not entree:
+            return None
+        nom = entree["variantes"].get(f"{taille[0]}x{taille[1]}")
+        if not nom:
+            return None
+        # Vérification peu coûteuse : la source n'a pas changé depuis la construction.
+        # Une source absente (déploiement sans les originaux) laisse l'image réduite valable.
+        try:
+            st = os.stat(chemin)
+        except OSError:
+            st = None
+        if st and (st.st_size != entree["octets"] or st.st_mtime_ns != entree["mtime_ns"]):
+            return None
+        return os.path.join(self.dossier_derives, nom)
+
+    def _charger_derive(self, chemin, taille, convertir=True):
+        derive = self._chemin_derive(chemin, taille)
+        if not derive:
+            return None
+        try:
+            image = pygame.image.load(derive)
+        except (FileNotFoundError, pygame.error):
+            return None
+        if image.get_size() != taille:
+            image = pygame.transform.scale(image, taille)
+        return self._convertir(image) if convertir else image
+
+    # --------------------------
+    # PRÉCHARGEMENT EN ARRIÈRE-PLAN
+    # --------------------------
+
+    def precharger(self, variantes, fils=None):
+        """
+        Lance le décodage des (chemin, taille) dans un groupe de fils.
+        Les images sont traitées dans l'ordre donné : mettre les moins urgentes à la fin.
+        Retourne la liste des Future correspondants (déjà terminés pour les images en cache).
+        """
+        if self._executeur is None:
+            fils = fils or min(4, os.cpu_count() or 1)
+            self._executeur = ThreadPoolExecutor(max_workers=fils, thread_name_prefix="assets")
+
+        futurs = []
+        for chemin, taille in variantes:
+            cle = (chemin, tuple(taille))
+            futur = self._en_attente.get(cle)
+            if futur is None:
+                if cle in self._cache or chemin in self._introuvables or self._depuis_paquet(chemin, cle[1]):
+                    futur = Future()
+                    futur.set_result(None)
+                else:
+                    futur = self._executeur.submit(self._decoder_en_tache, chemin, cle[1])
+                    self._en_attente[cle] = futur
+            futurs.append(futur)
+        return futurs
+
+    def _decoder_en_tache(self, chemin, taille):
+        """
+        Exécuté dans un fil du préchargeur (le décodage SDL relâche le GIL).
+        Ne touche ni au cache ni à l'affichage : la conversion se fait dans le fil principal.
+        """
+        with tracer("decoder_image", "assets", {"chemin": chemin, "taille": taille}):
+            image = self._charger_derive(chemin, taille, convertir=False)
+            if image is not None:
+                return image
+            try:
+                return pygame.transform.scale(pygame.image.load(chemin), taille)
+            except (FileNotFoundError, pygame.error):
+                return None
+
+    def _integrer(self, chemin, futur):
+        """Récupère le résultat d'un préchargement (attend s'il n'est pas fini) et le convertit"""
+        image = futur.result()
+        if image is None:
+            self._introuvables.add(chemin)
+            return None
+        return self._convertir(image)
+
+    def integrer_termines(self):
+        """À appeler depuis la boucle principale : range en cache les images déjà décodées"""
+        for cle, futur in list(self._en_attente.items()):
+            if futur.done():
+                del self._en_attente[cle]
+                image = self._integrer(cle[0], futur)
+                if image is not None and cle not in self._cache:
+                    self._stocker(cle, image)
+
+    def arreter_prechargement(self):
+        """Abandonne les décodages non commencés et libère les fils"""
+        if self._executeur is not None:
+            self._executeur.shutdown(wait=True, cancel_futures=True)
+            self._executeur = None
+        self._en_attente.clear()
+
+    @staticmethod
+    def _convertir(image):
+        """Convertit au format de l'affichage quand une fenêtre existe (blits beaucoup plus rapides)"""
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            if image.get_flags() & pygame.SRCALPHA:
+                return image.convert_alpha()
+            return image.convert()
+        return image
+
+    # --------------------------
+    # BUDGET MÉMOIRE
+    # --------------------------
+
+    def _stocker(self, cle, image):
+        """Ajoute une image au cache puis évince les moins récemment utilisées si besoin"""
+        self._cache[cle] = image
+        self.octets_utilises += self._taille_octets(image)
+        while self.octets_utilises > self.budget_octets and len(self._cache) > 1:
+            _, ancienne = self._cache.popitem(last=False)
+            self.octets_utilises -= self._taille_octets(ancienne)
+
+    @staticmethod
+    def _taille_octets(image):
+        largeur, hauteur = image.get_size()
+        return largeur * hauteur * image.get_bytesize()
+
+    def vider(self):
+        """Vide complètement le cache (les compteurs sont conservés)"""
+        self._cache.clear()
+        self._introuvables.clear()
+        self._manifeste = None
+        self._paquet = None
+        self._paquet_ouvert = False
+        self.octets_utilises = 0
+
+    def statistiques(self):
+        """Retourne les compteurs du cache (succès, échecs, taux, mémoire)"""
+        total = self.succes + self.echecs
+        return {
+            "succes": self.succes,
+            "echecs": self.echecs,
+            "taux_succes": self.succes / total if total else 0.0,
+            "entrees": len(self._cache),
+            "octets": self.octets_utilises,
+            "budget_octets": self.budget_octets,
+        }
+
+
+# Instance partagée par tous les écrans
+gestionnaire_assets = GestionnaireAssets()
+
+
+def charger_image(chemin, taille=None):
+    """Fonction utilitaire : image depuis le gestionnaire partagé"""
+    return gestionnaire_assets.obtenir_image(chemin, taille)
+
+
+# --------------------------
+# CONSTRUCTION HORS LIGNE
+# --------------------------
+
+def construire_derives(dossier_sortie=DOSSIER_DERIVES, forcer=False, variantes=None):
+    """
+    Produit les images pré-réduites pour chaque (chemin, taille) affiché.
+    Les sources dont l'empreinte n'a pas changé sont ignorées.
+    Retourne (nombre d'images générées, nombre de sources ignorées).
+    """
+    os.makedirs(dossier_sortie, exist_ok=True)
+    chemin_manifeste = os.path.join(dossier_sortie, FICHIER_MANIFESTE)
+    try:
+        with open(chemin_manifeste, encoding="utf-8") as f:
+            ancien = json.load(f)
+    except (OSError, ValueError):
+        ancien = {}
+
+    par_source = OrderedDict()
+    for chemin, taille in (variantes if variantes is not None else variantes_requises()):
+        par_source.setdefault(os.path.normpath(chemin), set()).add(tuple(taille))
+
+    manifeste = {}
+    generees = ignorees = 0
+    for chemin, tailles in par_source.items():
+        if not os.path.exists(chemin):
+            print(f"  absent : {chemin}")
+            continue
+        st = os.stat(chemin)
+        empreinte = _empreinte_fichier(chemin)
+        entree_prec = ancien.get(chemin, {})
+        variantes_prec = entree_prec.get("variantes", {}) if entree_prec.get("empreinte") == empreinte else {}
+
+        entree = {"empreinte": empreinte, "octets": st.st_size, "mtime_ns": st.st_mtime_ns, "variantes": {}}
+        image = None
+        for taille in sorted(tailles):
+            cle = f"{taille[0]}x{taille[1]}"
+            nom = _nom_variante(chemin, taille)
+            if not forcer and variantes_prec.get(cle) == nom and os.path.exists(os.path.join(dossier_sortie, nom)):
+                entree["variantes"][cle] = nom
+                continue
+            if image is None:
+                image = pygame.image.load(chemin)
+            pygame.image.save(pygame.transform.scale(image, taille), os.path.join(dossier_sortie, nom))
+            entree["variantes"][cle] = nom
+            generees += 1
+        if image is None:
+            ignorees += 1
+        manifeste[chemin] = entree
+
+    with open(chemin_manifeste, "w", encoding="utf-8") as f:
+        json.dump(manifeste, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return generees, ignorees
+
+
+def construire_paquet(chemin_paquet=FICHIER_PAQUET, variantes=None):
+    """
+    Écrit toutes les variantes affichées dans un seul fichier binaire (pixels bruts).
+    Retourne le nombre d'images empaquetées.
+    """
+    blocs = []
+    sources = {}
+    vues = set()
+    for chemin, taille in (variantes if variantes is not None else variantes_requises()):
+        taille = tuple(taille)
+        nom = _cle_paquet(chemin, taille)
+        if nom in vues:
+            continue
+        vues.add(nom)
+        chemin = os.path.normpath(chemin)
+        if chemin not in sources:
+            sources[chemin] = (pygame.image.load(chemin), os.stat(chemin)) if os.path.exists(chemin) else None
+        if sources[chemin] is None:
+            print(f"  absent : {chemin}")
+            continue
+        source, st = sources[chemin]
+        image = pygame.transform.scale(source, taille)
+        format_pixels = "RGBA" if image.get_flags() & pygame.SRCALPHA else "RGBX"
+        blocs.append((nom, taille, format_pixels, pygame.image.tobytes(image, format_pixels), st))
+
+    taille_index = _EN_TETE.size + sum(
+        _NOM.size + len(nom.encode("utf-8")) + _ENTREE.size for nom, _, _, _, _ in blocs
+    )
+    decalage = -(-taille_index // _ALIGNEMENT) * _ALIGNEMENT
+    index = [_EN_TETE.pack(MAGIE_PAQUET, VERSION_PAQUET, len(blocs))]
+    donnees = []
+    for nom, taille, format_pixels, pixels, st in blocs:
+        nom_octets = nom.encode("utf-8")
+        index.append(_NOM.pack(len(nom_octets)) + nom_octets)
+        index.append(_ENTREE.pack(
+            taille[0], taille[1], format_pixels.encode("ascii"), decalage, len(pixels),
+            st.st_size, st.st_mtime_ns,
+        ))
+        remplissage = -len(pixels) % _ALIGNEMENT
+        donnees.append(pixels + b"\0" * remplissage)
+        decalage += len(pixels) + remplissage
+
+    en_tete = b"".join(index)
+    provisoire = chemin_paquet + ".tmp"
+    with open(provisoire, "wb") as f:
+        f.write(en_tete)
+        f.write(b"\0" * (-len(en_tete) % _ALIGNEMENT))
+        for bloc in donnees:
+            f.write(bloc)
+    os.replace(provisoire, chemin_paquet)
+    return len(blocs)
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(prog="python -m assets", description="Outils de préparation des images")
+    sous = parser.add_subparsers(dest="commande", required=True)
+
+    build = sous.add_parser("build", help="génère les images pré-réduites aux tailles affichées")
+    build.add_argument("--sortie", default=DOSSIER_DERIVES, help="dossier de destination")
+    build.add_argument("--force", action="store_true", help="régénère même les sources inchangées")
+
+    pack = sous.add_parser("pack", help="regroupe les images affichées dans un paquet binaire unique")
+    pack.add_argument("--sortie", default=FICHIER_PAQUET, help="fichier paquet à écrire")
+
+    args = parser.parse_args(argv)
+    if args.commande == "build":
+        generees, ignorees = construire_derives(args.sortie, forcer=args.force)
+        print(f"{generees} image(s) générée(s), {ignorees} source(s) inchangée(s)")
+    elif args.commande == "pack":
+        nombre = construire_paquet(args.sortie)
+        print(f"{nombre} image(s) empaquetée(s) dans {args.sortie}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
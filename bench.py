@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc de mesure des écrans du jeu Boulange
+Fait jouer à chaque écran un scénario représentatif (hors écran, horloge simulée),
+mesure par image les temps de mettre_a_jour et de rendu (p50/p95/p99, en ms)
+ainsi que la mémoire allouée (tracemalloc), et compare à une référence JSON :
+
+    python3 -m bench                             # mesure et compare à bench_reference.json
+    python3 -m bench --enregistrer               # mesure et remplace la référence
+    python3 -m bench --seuil 0.25 --images 600   # tolérance de 25 %, 600 images par scénario
+
+Code de sortie 1 si un p95 dépasse la référence de plus du seuil.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import pygame
+import sans_affichage
+from assets import gestionnaire_assets
+from game import Game
+from horloge import HorlogeSimulation
+from recipes import RECETTES, TOUS_INGREDIENTS, valider_cuisson
+from ui_components import accepte_evenement
+
+FICHIER_REFERENCE = "bench_reference.json"
+SEUIL_DEFAUT = 0.30       # +30 % sur un p95 (il varie d'environ 20 % d'un lancement à l'autre)
+ECART_MINIMAL_MS = 0.10   # en dessous, l'écart est du bruit de mesure
+IMAGES_DEFAUT = 300
+IMAGES_CHAUFFE = 30
+REPETITIONS_DEFAUT = 3    # on garde la meilleure des passes (moins sensible au bruit de la machine)
+PAS = 1 / 60
+
+
+# --------------------------
+# SCÉNARIOS
+# --------------------------
+
+def _envoyer(jeu, evenement):
+    """Transmet un événement à l'écran courant, comme la boucle du jeu"""
+    ecran = jeu.ecrans[jeu.ecran_actuel]
+    if accepte_evenement(ecran, evenement):
+        ecran.gerer_evenement(evenement)
+
+
+def scenario_accueil(jeu):
+    """Survol en rafale : la souris balaie les trois boutons de recette"""
+    jeu.changer_ecran("accueil")
+    image = 0
+    while True:
+        x = 60 + (image * 37) % (jeu.largeur - 120)
+        y = 300 + (image * 13) % 180
+        _envoyer(jeu, pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0)))
+        image += 1
+        yield
+
+
+def scenario_selection(jeu):
+    """Mauvaises sélections en série : mélange de la grille, puis aide après 5 erreurs"""
+    jeu.choisir_recette("pain")
+    ecran = jeu.ecrans["selection_ingredients"]
+    mauvais = [i for i in TOUS_INGREDIENTS if i not in RECETTES["pain"]["ingredients_requis"]]
+    image = 0
+    while True:
+        if ecran.afficher_aide:
+            if image % 20 == 0:
+                _envoyer(jeu, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode=""))
+        elif image % 4 == 0:
+            ecran.basculer_ingredient(mauvais[image % len(mauvais)])
+            ecran.valider_selection()
+        image += 1
+        yield
+
+
+def scenario_petrissage(jeu):
+    """Animation complète du pétrissage, relancée à chaque passage à la cuisson"""
+    jeu.choisir_recette("pain")
+    jeu.changer_ecran("petrissage")
+    while True:
+        if jeu.ecran_actuel != "petrissage":
+            jeu.changer_ecran("petrissage")
+        yield
+
+
+def scenario_cuisson(jeu):
+    """Fenêtre d'aide ouverte et refermée en boucle, souris en mouvement sur les compteurs"""
+    jeu.choisir_recette("pain")
+    jeu.changer_ecran("cuisson")
+    ecran = jeu.ecrans["cuisson"]
+    image = 0
+    while True:
+        if not ecran.afficher_aide:
+            jeu.aide_cuisson_pending = True
+        elif image % 30 == 0:
+            _envoyer(jeu, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode=""))
+        x = jeu.largeur // 2 + (image * 11) % 300
+        _envoyer(jeu, pygame.event.Event(pygame.MOUSEMOTION, pos=(x, 300), rel=(0, 0), buttons=(0, 0, 0)))
+        image += 1
+        yield
+
+
+def scenario_pedagogique(jeu):
+    """Longs défilements à la molette, dans un sens puis dans l'autre"""
+    jeu.choisir_recette("pain")
+    jeu.temperature_choisie, jeu.temps_choisi = 300, 60
+    jeu.resultat_cuisson = valider_cuisson("pain", 300, 60)
+    jeu.changer_ecran("pedagogique")
+    image = 0
+    while True:
+        sens = -1 if (image // 40) % 2 == 0 else 1
+        _envoyer(jeu, pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=sens, flipped=False))
+        image += 1
+        yield
+
+
+SCENARIOS = {
+    "accueil": scenario_accueil,
+    "selection_ingredients": scenario_selection,
+    "petrissage": scenario_petrissage,
+    "cuisson": scenario_cuisson,
+    "pedagogique": scenario_pedagogique,
+}
+
+
+# --------------------------
+# MESURE
+# --------------------------
+
+def creer_jeu():
+    """Jeu hors écran sur horloge simulée, images de départ chargées"""
+    sans_affichage.preparer_pilotes()
+    jeu = Game(HorlogeSimulation("rapide", pas=PAS), hors_ecran=True)
+    while jeu.ecran_actuel == "chargement":
+        jeu.ecrans["chargement"].mettre_a_jour()
+    return jeu
+
+
+def _image(jeu, etape):
+    """Une image du scénario : (durée de mettre_a_jour, durée du rendu) en secondes"""
+    next(etape)
+    jeu.horloge_simulation.avancer(PAS)
+    jeu.planificateur.executer_echues()
+    ecran = jeu.ecrans[jeu.ecran_actuel]
+    debut = time.perf_counter()
+    ecran.mettre_a_jour()
+    milieu = time.perf_counter()
+    jeu._rendre()
+    return milieu - debut, time.perf_counter() - milieu
+
+
+def centiles(valeurs):
+    """p50/p95/p99 (rang le plus proche) d'une liste de durées en secondes, en ms"""
+    triees = sorted(valeurs)
+    resultat = {}
+    for p in (50, 95, 99):
+        rang = max(0, math.ceil(p / 100 * len(triees)) - 1)
+        resultat[f"p{p}"] = round(triees[rang] * 1000, 4)
+    return resultat
+
+
+def _demarrer(jeu, nom):
+    """Scénario relancé depuis l'accueil, après quelques images de chauffe"""
+    random.seed(0)
+    jeu.reinitialiser_jeu()
+    etape = SCENARIOS[nom](jeu)
+    for _ in range(IMAGES_CHAUFFE):
+        _image(jeu, etape)
+    return etape
+
+
+def _meilleurs(passes):
+    """Minimum, centile par centile, sur plusieurs passes"""
+    return {p: min(passe[p] for passe in passes) for p in passes[0]}
+
+
+def mesurer_scenario(jeu, nom, images, repetitions=REPETITIONS_DEFAUT):
+    """Chronométrage (meilleure de plusieurs passes) puis allocations par image"""
+    passes_maj, passes_rendu = [], []
+    for _ in range(repetitions):
+        etape = _demarrer(jeu, nom)
+        durees_maj, durees_rendu = [], []
+        for _ in range(images):
+            maj, rendu = _image(jeu, etape)
+            durees_maj.append(maj)
+            durees_rendu.append(rendu)
+        passes_maj.append(centiles(durees_maj))
+        passes_rendu.append(centiles(durees_rendu))
+
+    # tracemalloc ralentit tout : les allocations sont mesurées à part
+    etape = _demarrer(jeu, nom)
+    pics, retenus = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(images):
+            avant, _pic = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            _image(jeu, etape)
+            apres, pic = tracemalloc.get_traced_memory()
+            pics.append(pic - avant)
+            retenus.append(apres - avant)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "mettre_a_jour_ms": _meilleurs(passes_maj),
+        "dessiner_ms": _meilleurs(passes_rendu),
+        "allocations_par_image": {
+            "pic_octets_p50": sorted(pics)[len(pics) // 2],
+            "pic_octets_max": max(pics),
+            "retenus_octets_moyenne": round(sum(retenus) / len(retenus), 1),
+        },
+    }
+
+
+def executer_bench(noms, images, repetitions=REPETITIONS_DEFAUT):
+    jeu = creer_jeu()
+    return {
+        "images": images,
+        "repetitions": repetitions,
+        "pygame": pygame.version.ver,
+        "python": sys.version.split()[0],
+        "scenarios": {nom: mesurer_scenario(jeu, nom, images, repetitions) for nom in noms},
+    }
+
+
+def regressions(resultats, reference, seuil):
+    """Liste des p95 qui dépassent la référence de plus du seuil"""
+    trouvees = []
+    for nom, mesures in resultats["scenarios"].items():
+        ancien = reference.get("scenarios", {}).get(nom)
+        if not ancien:
+            continue
+        for cle in ("mettre_a_jour_ms", "dessiner_ms"):
+            avant, apres = ancien[cle]["p95"], mesures[cle]["p95"]
+            if apres > avant * (1 + seuil) and apres - avant > ECART_MINIMAL_MS:
+                trouvees.append(f"{nom}.{cle} p95 : {avant:.3f} → {apres:.3f} ms")
+    return trouvees
+
+
+def afficher(resultats):
+    print(f"{'scénario':<24}{'màj p50/p95/p99 (ms)':<26}{'rendu p50/p95/p99 (ms)':<26}pic alloc p50")
+    for nom, m in resultats["scenarios"].items():
+        maj = "/".join(f"{m['mettre_a_jour_ms'][p]:.3f}" for p in ("p50", "p95", "p99"))
+        rendu = "/".join(f"{m['dessiner_ms'][p]:.3f}" for p in ("p50", "p95", "p99"))
+        print(f"{nom:<24}{maj:<26}{rendu:<26}{m['allocations_par_image']['pic_octets_p50']} o")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc de mesure des écrans de Boulange")
+    parser.add_argument("--images", type=int, default=IMAGES_DEFAUT, help="images mesurées par scénario")
+    parser.add_argument("--repetitions", type=int, default=REPETITIONS_DEFAUT,
+                        help="passes de chronométrage par scénario (la meilleure est retenue)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help="scénarios à jouer, séparés par des virgules")
+    parser.add_argument("--reference", default=FICHIER_REFERENCE, help="fichier JSON de référence")
+    parser.add_argument("--seuil", type=float, default=SEUIL_DEFAUT,
+                        help="régression tolérée sur un p95 (0.30 = +30 %%)")
+    parser.add_argument("--enregistrer", action="store_true", help="écrit les résultats comme nouvelle référence")
+    parser.add_argument("--sortie", help="écrit aussi les résultats dans ce fichier JSON")
+    arguments = parser.parse_args(argv)
+
+    noms = [n.strip() for n in arguments.scenarios.split(",") if n.strip()]
+    inconnus = [n for n in noms if n not in SCENARIOS]
+    if inconnus:
+        parser.error(f"scénario(s) inconnu(s) : {', '.join(inconnus)}")
+
+    resultats = executer_bench(noms, arguments.images, max(1, arguments.repetitions))
+    afficher(resultats)
+
+    if arguments.sortie:
+        with open(arguments.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2, ensure_ascii=False)
+
+    if arguments.enregistrer:
+        with open(arguments.reference, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2, ensure_ascii=False)
+        print(f"Référence enregistrée : {arguments.reference}")
+        return 0
+
+    if not os.path.exists(arguments.reference):
+        print(f"Pas de référence ({arguments.reference}) : relancer avec --enregistrer pour en créer une")
+        return 0
+
+    with open(arguments.reference, encoding="utf-8") as fichier:
+        reference = json.load(fichier)
+    trouvees = regressions(resultats, reference, arguments.seuil)
+    for ligne in trouvees:
+        print(f"RÉGRESSION {ligne}")
+    if trouvees:
+        return 1
+    print(f"Aucune régression au-delà de {arguments.seuil:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        code = main()
+    finally:
+        gestionnaire_assets.arreter_prechargement()
+        pygame.quit()
+    sys.exit(code)
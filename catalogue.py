@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Catalogue des recettes du jeu Boulange
+Lit les ingrédients et les recettes dans un fichier de données (JSON, ou TOML avec
+Python 3.11+) et vérifie chaque recette. Le résultat est compilé dans un cache binaire
+associé à l'empreinte de la source : les lancements suivants ne relisent ni ne
+revérifient rien, et chaque recette n'est décodée qu'à sa première lecture.
+
+    python -m catalogue                       (vérifie et compile le catalogue)
+    python -m catalogue --source autre.json   (autre catalogue ; voir aussi BOULANGE_CATALOGUE)
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11 : catalogues JSON seulement
+    tomllib = None
+
+FICHIER_CATALOGUE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "donnees", "recettes.json")
+VERSION_CATALOGUE = 1
+
+# Format du cache : en-tête, noms, décalages, puis enregistrements
+#   en-tête : magie (4s), version (H), empreinte SHA-256 de la source (32s),
+#             taille (Q) et mtime_ns (Q) de la source, nombre d'ingrédients (I),
+#             nombre de recettes (I), nombre de recettes de l'accueil (I), longueur des noms (I)
+#   noms    : ingrédients, recettes puis recettes de l'accueil, UTF-8, séparés par "\n"
+#   décalages : nombre de recettes + 1 entiers (Q), depuis le début des enregistrements
+#   enregistrements : chaque recette vérifiée, en JSON compact
+# La version est à incrémenter si le format ou les règles de vérification changent.
+MAGIE_CACHE = b"BLRC"
+VERSION_CACHE = 2
+_EN_TETE = struct.Struct("<4sH32sQQIIII")
+
+# Schéma d'une recette : champ -> types acceptés
+NOMBRE = (int, float)
+CHAMPS_RECETTE = {
+    "nom": str,
+    "ingredients_requis": list,
+    "temperature_ideale": NOMBRE,
+    "tolerance_temp": NOMBRE,
+    "temps_ideal": NOMBRE,
+    "tolerance_temps": NOMBRE,
+    "images": dict,
+}
+IMAGES_RECETTE = ("base", "reussie", "cru", "brule")
+IMAGES_OBLIGATOIRES = ("base", "reussie")
+ERREURS_AFFICHEES = 50
+
+
+def chemin_cache(source):
+    """Cache compilé d'une source : un fichier par source, dans le cache de l'utilisateur"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cle = hashlib.sha1(os.path.abspath(source).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base, "boulange", f"recettes-{cle}.cache")
+
+
+# --------------------------
+# VÉRIFICATION
+# --------------------------
+
+def _nom_valide(nom):
+    return isinstance(nom, str) and nom != "" and "\n" not in nom
+
+
+def _erreurs_recette(nom, recette, ingredients_connus):
+    """Écarts d'une recette au schéma (CHAMPS_RECETTE)"""
+    if not _nom_valide(nom):
+        yield "nom de recette invalide"
+    if not isinstance(recette, dict):
+        yield "un objet est attendu"
+        return
+    for champ, types in CHAMPS_RECETTE.items():
+        if champ not in recette:
+            yield f"champ {champ!r} manquant"
+        elif isinstance(recette[champ], bool) or not isinstance(recette[champ], types):
+            yield f"champ {champ!r} : type {type(recette[champ]).__name__} invalide"
+    for champ in recette:
+        if champ not in CHAMPS_RECETTE:
+            yield f"champ inconnu {champ!r}"
+
+    for champ in ("tolerance_temp", "tolerance_temps"):
+        valeur = recette.get(champ)
+        if isinstance(valeur, NOMBRE) and valeur < 0:
+            yield f"{champ} négative"
+
+    requis = recette.get("ingredients_requis")
+    if isinstance(requis, list):
+        if not requis:
+            yield "aucun ingrédient requis"
+        vus = set()
+        for ingredient in requis:
+            if not isinstance(ingredient, str) or ingredient not in ingredients_connus:
+                yield f"ingrédient inconnu {ingredient!r}"
+            elif ingredient in vus:
+                yield f"ingrédient en double {ingredient!r}"
+            else:
+                vus.add(ingredient)
+
+    images = recette.get("images")
+    if isinstance(images, dict):
+        for statut in IMAGES_OBLIGATOIRES:
+            if statut not in images:
+                yield f"image {statut!r} manquante"
+        for statut, fichier in images.items():
+            if statut not in IMAGES_RECETTE:
+                yield f"image inconnue {statut!r}"
+            elif not isinstance(fichier, str):
+                yield f"image {statut!r} : un nom de fichier est attendu"
+
+
+def valider_catalogue(donnees, source="catalogue"):
+    """
+    Vérifie un catalogue décodé ; retourne (ingrédients, recettes, accueil).
+    « accueil », facultatif, liste les recettes proposées sur l'écran d'accueil.
+    Lève ValueError avec la liste des erreurs trouvées.
+    """
+    if not isinstance(donnees, dict):
+        raise ValueError(f"{source} : un objet est attendu à la racine")
+
+    erreurs = []
+    if donnees.get("version", VERSION_CATALOGUE) != VERSION_CATALOGUE:
+        erreurs.append(f"version {donnees['version']!r} non prise en charge")
+    for champ in donnees:
+        if champ not in ("version", "ingredients", "recettes", "accueil"):
+            erreurs.append(f"champ inconnu {champ!r}")
+
+    ingredients = donnees.get("ingredients")
+    if not isinstance(ingredients, list) or not all(_nom_valide(i) for i in ingredients):
+        erreurs.append("« ingredients » doit être une liste de noms")
+        ingredients = []
+    elif len(set(ingredients)) != len(ingredients):
+        erreurs.append("ingrédients en double")
+
+    recettes = donnees.get("recettes")
+    if not isinstance(recettes, dict):
+        erreurs.append("« recettes » doit être un objet nom -> recette")
+        recettes = {}
+    connus = set(ingredients)
+    for nom, recette in recettes.items():
+        erreurs.extend(f"recette {nom!r} : {erreur}" for erreur in _erreurs_recette(nom, recette, connus))
+
+    accueil = donnees.get("accueil", [])
+    if not isinstance(accueil, list):
+        erreurs.append("« accueil » doit être une liste de noms de recettes")
+        accueil = []
+    else:
+        inconnues = [nom for nom in accueil if not isinstance(nom, str) or nom not in recettes]
+        erreurs.extend(f"accueil : recette inconnue {nom!r}" for nom in inconnues)
+        if not inconnues and len(set(accueil)) != len(accueil):
+            erreurs.append("accueil : recettes en double")
+
+    if erreurs:
+        lignes = erreurs[:ERREURS_AFFICHEES]
+        if len(erreurs) > ERREURS_AFFICHEES:
+            lignes.append(f"… et {len(erreurs) - ERREURS_AFFICHEES} autre(s)")
+        raise ValueError(f"{source} : catalogue invalide\n  " + "\n  ".join(lignes))
+    return ingredients, recettes, accueil
+
+
+def _decoder_source(source, octets):
+    """Données d'un catalogue JSON ou TOML (ValueError si illisible)"""
+    if source.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError(f"{source} : les catalogues TOML demandent Python 3.11 ou plus")
+        return tomllib.loads(octets.decode("utf-8"))
+    return json.loads(octets)
+
+
+# --------------------------
+# CACHE COMPILÉ
+# --------------------------
+
+class CatalogueRecettes(Mapping):
+    """
+    Recettes d'un cache compilé : fichier projeté en mémoire (mmap), ou octets compilés
+    gardés en mémoire si le cache n'a pas pu être écrit. Seuls les noms sont lus à
+    l'ouverture ; chaque recette est décodée à sa première lecture puis gardée
+    (le dictionnaire renvoyé reste modifiable, pas le catalogue lui-même).
+    """
+
+    def __init__(self, carte, chemin="<mémoire>"):
+        self.chemin = chemin
+        self._carte = carte
+        (magie, version, self.empreinte, self.taille_source, self.mtime_source,
+         nb_ingredients, nb_recettes, nb_accueil, longueur_noms) = _EN_TETE.unpack_from(self._carte, 0)
+        if magie != MAGIE_CACHE or version != VERSION_CACHE:
+            raise ValueError(f"{chemin} : cache de catalogue invalide")
+
+        pos = _EN_TETE.size
+        noms = self._carte[pos:pos + longueur_noms].decode("utf-8").split("\n") if longueur_noms else []
+        self.ingredients = noms[:nb_ingredients]
+        self._positions = {nom: i for i, nom in enumerate(noms[nb_ingredients:nb_ingredients + nb_recettes])}
+        # Recettes de l'accueil choisies par le catalogue (vide : au choix du jeu)
+        self.accueil = noms[nb_ingredients + nb_recettes:]
+        pos += longueur_noms
+
+        self._decalages = array("Q")
+        self._decalages.frombytes(self._carte[pos:pos + self._decalages.itemsize * (nb_recettes + 1)])
+        if sys.byteorder == "big":
+            self._decalages.byteswap()
+        self._debut = pos + self._decalages.itemsize * (nb_recettes + 1)
+        if len(self._positions) != nb_recettes or len(self.accueil) != nb_accueil or self._debut + self._decalages[-1] != len(self._carte):
+            raise ValueError(f"{chemin} : cache de catalogue tronqué")
+        self._recettes = {}  # nom -> recette déjà décodée
+
+    def __getitem__(self, nom):
+        recette = self._recettes.get(nom)
+        if recette is None:
+            i = self._positions[nom]
+            debut = self._debut + self._decalages[i]
+            recette = self._recettes[nom] = json.loads(self._carte[debut:self._debut + self._decalages[i + 1]])
+        return recette
+
+    def __contains__(self, nom):
+        return nom in self._positions
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+    @classmethod
+    def depuis_fichier(cls, chemin):
+        with open(chemin, "rb") as fichier:
+            return cls(mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ), chemin)
+
+    @classmethod
+    def ouvrir(cls, chemin, source):
+        """Ouvre le cache s'il est valide et correspond au contenu de `source`, sinon None"""
+        try:
+            catalogue = cls.depuis_fichier(chemin)
+            st = os.stat(source)
+        except (OSError, ValueError, struct.error):
+            return None
+        if (st.st_size, st.st_mtime_ns) == (catalogue.taille_source, catalogue.mtime_source):
+            return catalogue
+        # Source touchée depuis la compilation : seul un contenu différent invalide le cache
+        try:
+            with open(source, "rb") as fichier:
+                empreinte = hashlib.sha256(fichier.read()).digest()
+        except OSError:
+            return None
+        return catalogue if empreinte == catalogue.empreinte else None
+
+
+def _compiler(empreinte, st, ingredients, recettes, accueil):
+    """Octets du cache compilé (format décrit en tête de module)"""
+    enregistrements = [
+        json.dumps(recette, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        for recette in recettes.values()
+    ]
+    decalages = array("Q", [0])
+    for enregistrement in enregistrements:
+        decalages.append(decalages[-1] + len(enregistrement))
+    if sys.byteorder == "big":
+        decalages.byteswap()
+    noms = "\n".join(list(ingredients) + list(recettes) + list(accueil)).encode("utf-8")
+    en_tete = _EN_TETE.pack(
+        MAGIE_CACHE, VERSION_CACHE, empreinte, st.st_size, st.st_mtime_ns,
+        len(ingredients), len(recettes), len(accueil), len(noms),
+    )
+    return b"".join([en_tete, noms, decalages.tobytes()] + enregistrements)
+
+
+def _ecrire_cache(chemin, octets):
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    provisoire = chemin + ".tmp"
+    with open(provisoire, "wb") as fichier:
+        fichier.write(octets)
+    os.replace(provisoire, chemin)
+
+
+def compiler_catalogue(source=FICHIER_CATALOGUE, cache=None):
+    """
+    Lit et vérifie `source`, puis écrit son cache compilé.
+    Retourne (ingrédients, CatalogueRecettes) ; le cache disque est facultatif : s'il ne
+    peut pas être écrit, le catalogue compilé reste en mémoire pour ce lancement.
+    """
+    with open(source, "rb") as fichier:
+        st = os.fstat(fichier.fileno())
+        octets = fichier.read()
+    ingredients, recettes, accueil = valider_catalogue(_decoder_source(source, octets), source)
+    compile = _compiler(hashlib.sha256(octets).digest(), st, ingredients, recettes, accueil)
+    cache = cache or chemin_cache(source)
+    try:
+        _ecrire_cache(cache, compile)
+        catalogue = CatalogueRecettes.depuis_fichier(cache)
+    except OSError:
+        catalogue = CatalogueRecettes(compile)  # le catalogue sera recompilé au prochain lancement
+    return catalogue.ingredients, catalogue
+
+
+def charger_catalogue(source=None, cache=None):
+    """
+    Retourne (ingrédients, recettes) du catalogue `source` (par défaut la variable
+    d'environnement BOULANGE_CATALOGUE, sinon donnees/recettes.json).
+    Le cache compilé est utilisé s'il correspond à la source, sinon il est reconstruit.
+    """
+    source = source or os.environ.get("BOULANGE_CATALOGUE") or FICHIER_CATALOGUE
+    cache = cache or chemin_cache(source)
+    catalogue = CatalogueRecettes.ouvrir(cache, source)
+    if catalogue is not None:
+        return catalogue.ingredients, catalogue
+    return compiler_catalogue(source, cache)
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(prog="python -m catalogue", description="Vérifie et compile le catalogue")
+    parser.add_argument("--source", default=os.environ.get("BOULANGE_CATALOGUE") or FICHIER_CATALOGUE,
+                        help="catalogue JSON ou TOML")
+    args = parser.parse_args(argv)
+    try:
+        ingredients, recettes = compiler_catalogue(args.source)
+    except (OSError, ValueError) as erreur:
+        print(erreur)
+        return 1
+    print(f"{len(recettes)} recette(s), {len(ingredients)} ingrédient(s) compilés dans {recettes.chemin}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
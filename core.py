@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cœur du jeu Boulange (sans pygame)
+État d'une partie et actions du parcours de l'apprenant : choix de la recette,
+sélection et validation des ingrédients, pétrissage, cuisson, aides et chronomètre.
+Les écrans ne sont que des vues sur cet état ; sans SDL, le parcours complet peut
+être simulé en masse (analyses, simulations d'apprenants).
+Le temps est toujours passé en argument (`maintenant`, en secondes) : le cœur ne
+lit aucune horloge.
+"""
+
+from recipes import (
+    BITS_INGREDIENTS, RECETTES, TOUS_INGREDIENTS, ingredients_du_masque, masque_ingredients,
+    valider_cuisson, valider_ingredients,
+)
+
+DUREE_PARTIE = 300         # 5 minutes
+ERREURS_AVANT_AIDE = 5     # mauvaises sélections d'ingrédients avant l'aide
+ECHECS_AVANT_AIDE = 5      # cuissons ratées d'affilée avant l'aide
+TEMPERATURE_DEFAUT = 180
+TEMPS_DEFAUT = 20
+
+# Étapes du parcours (mêmes noms que les écrans qui les affichent)
+ACCUEIL = "accueil"
+SELECTION = "selection_ingredients"
+PETRISSAGE = "petrissage"
+CUISSON = "cuisson"
+RESULTAT = "resultat"
+PEDAGOGIQUE = "pedagogique"
+TEMPS_ECOULE = "temps_ecoule"
+ETAPES = (ACCUEIL, SELECTION, PETRISSAGE, CUISSON, RESULTAT, PEDAGOGIQUE, TEMPS_ECOULE)
+
+# Actions applicables par nom (Partie.appliquer), pour rejouer ou simuler un parcours
+ACTIONS = frozenset({
+    "choisir_recette", "changer_recette", "basculer_ingredient", "vider_selection",
+    "valider_ingredients", "prendre_aide_ingredients", "terminer_petrissage",
+    "regler_cuisson", "lancer_cuisson", "prendre_aide_cuisson", "reessayer_cuisson",
+    "afficher_bilan", "arreter_chrono", "verifier_temps", "expirer", "recommencer",
+})
+
+
+class Partie:
+    """État d'une partie ; chaque méthode publique est une action du parcours"""
+
+    __slots__ = (
+        "duree", "etape", "recette", "selection", "temperature", "temps",
+        "erreurs_ingredients", "echecs_cuisson", "aide_ingredients", "aide_cuisson",
+        "resultat", "debut", "temps_final",
+    )
+
+    def __init__(self, duree=DUREE_PARTIE):
+        self.duree = duree
+        self.recommencer()
+
+    def appliquer(self, action, *arguments):
+        """Applique une action désignée par son nom (voir ACTIONS)"""
+        if action not in ACTIONS:
+            raise ValueError(f"Action inconnue : {action!r}")
+        return getattr(self, action)(*arguments)
+
+    # --------------------------
+    # CHRONOMÈTRE
+    # --------------------------
+
+    def temps_restant(self, maintenant):
+        """Secondes entières restantes (la durée complète si le chrono est arrêté)"""
+        if self.debut is None:
+            return self.duree
+        return max(0, self.duree - int(maintenant - self.debut))
+
+    def temps_ecoule(self, maintenant):
+        """Secondes entières depuis le choix de la recette (ou temps final), None hors partie"""
+        if self.temps_final is not None:
+            return self.temps_final
+        if self.debut is None:
+            return None
+        return int(maintenant - self.debut)
+
+    def arreter_chrono(self, maintenant):
+        """Stoppe le chrono et enregistre le temps total écoulé"""
+        if self.debut is not None:
+            self.temps_final = int(maintenant - self.debut)
+            self.debut = None
+
+    def verifier_temps(self, maintenant):
+        """Termine la partie si le temps est écoulé ; retourne True dans ce cas"""
+        if self.debut is not None and maintenant - self.debut >= self.duree:
+            self.expirer()
+            return True
+        return False
+
+    def expirer(self):
+        """Temps écoulé : la partie s'arrête (seul recommencer en sort)"""
+        self.debut = None
+        self.etape = TEMPS_ECOULE
+
+    @property
+    def terminee(self):
+        """True une fois le temps écoulé : les actions du parcours ne changent plus l'étape"""
+        return self.etape == TEMPS_ECOULE
+
+    # --------------------------
+    # ACTIONS DU PARCOURS
+    # --------------------------
+
+    def recommencer(self):
+        """Redémarre depuis l'accueil"""
+        self.etape = ACCUEIL
+        self.recette = None
+        self.selection = 0  # masque des ingrédients sélectionnés (recipes.BITS_INGREDIENTS)
+        self.temperature = TEMPERATURE_DEFAUT
+        self.temps = TEMPS_DEFAUT
+        self.erreurs_ingredients = 0
+        self.echecs_cuisson = 0
+        self.aide_ingredients = False
+        self.aide_cuisson = False
+        self.resultat = None
+        self.debut = None
+        self.temps_final = None
+
+    def choisir_recette(self, nom, maintenant):
+        """Choisit la recette et démarre le chrono ; retourne False si elle n'existe pas"""
+        if nom not in RECETTES:
+            return False
+        self.recette = nom
+        self.selection = 0
+        self.erreurs_ingredients = 0
+        self.echecs_cuisson = 0
+        self.aide_ingredients = False
+        self.aide_cuisson = False
+        self.debut = maintenant
+        self.temps_final = None
+        self.etape = SELECTION
+        return True
+
+    def changer_recette(self):
+        """Retour à l'accueil pour choisir une autre recette (le chrono continue)"""
+        if not self.terminee:
+            self.etape = ACCUEIL
+
+    @property
+    def ingredients(self):
+        """Noms des ingrédients sélectionnés (ordre de TOUS_INGREDIENTS)"""
+        return ingredients_du_masque(self.selection)
+
+    @ingredients.setter
+    def ingredients(self, ingredients):
+        self.selection = masque_ingredients(ingredients)
+
+    def basculer_ingredient(self, ingredient):
+        """Ajoute ou retire un ingrédient ; retourne True s'il est maintenant sélectionné"""
+        bit = BITS_INGREDIENTS[ingredient]
+        self.selection ^= bit
+        return bool(self.selection & bit)
+
+    def vider_selection(self):
+        self.selection = 0
+
+    def valider_ingredients(self):
+        """
+        Valide la sélection. Bonne : passage au pétrissage. Mauvaise : une erreur de plus,
+        sélection vidée, et l'aide est demandée à la 5e erreur. Retourne True si c'est bon.
+        """
+        if self.recette is None or self.terminee:
+            return False
+        if valider_ingredients(self.recette, self.selection):
+            self.etape = PETRISSAGE
+            return True
+        self.erreurs_ingredients += 1
+        self.selection = 0
+        if self.erreurs_ingredients >= ERREURS_AVANT_AIDE:
+            self.aide_ingredients = True
+        return False
+
+    def prendre_aide_ingredients(self):
+        """Retourne True (une seule fois) si l'aide aux ingrédients est due ; le compte repart de zéro"""
+        if not self.aide_ingredients:
+            return False
+        self.aide_ingredients = False
+        self.erreurs_ingredients = 0
+        return True
+
+    def terminer_petrissage(self):
+        if not self.terminee:
+            self.etape = CUISSON
+
+    def regler_cuisson(self, temperature=None, temps=None):
+        if temperature is not None:
+            self.temperature = temperature
+        if temps is not None:
+            self.temps = temps
+
+    def lancer_cuisson(self):
+        """Cuit avec les réglages courants, passe au résultat et retourne le résultat"""
+        if self.recette is None or self.terminee:
+            return None
+        resultat = valider_cuisson(self.recette, self.temperature, self.temps)
+        if resultat.get("succes"):
+            self.echecs_cuisson = 0
+        else:
+            self.echecs_cuisson += 1
+            if self.echecs_cuisson >= ECHECS_AVANT_AIDE:
+                # Au bout de 5 échecs consécutifs, l'aide s'affichera au retour à la cuisson
+                self.aide_cuisson = True
+                self.echecs_cuisson = 0
+        self.resultat = resultat
+        self.etape = RESULTAT
+        return resultat
+
+    def prendre_aide_cuisson(self):
+        """Retourne True (une seule fois) si l'aide à la cuisson est due"""
+        if not self.aide_cuisson:
+            return False
+        self.aide_cuisson = False
+        return True
+
+    def reessayer_cuisson(self):
+        if not self.terminee:
+            self.etape = CUISSON
+
+    def afficher_bilan(self):
+        """Après une réussite : page pédagogique"""
+        if not self.terminee:
+            self.etape = PEDAGOGIQUE
+
+
+# --------------------------
+# SIMULATION SANS AFFICHAGE
+# --------------------------
+
+def simuler_apprenant(rng, recette=None, secondes_par_action=3.0, duree=DUREE_PARTIE):
+    """
+    Joue une partie complète avec un apprenant qui tâtonne au hasard (`rng` : random.Random).
+    Il essaie des sélections puis des réglages de cuisson au hasard, et applique les bonnes
+    réponses une fois l'aide affichée ; chaque action prend `secondes_par_action`.
+    Retourne la Partie finale (étape PEDAGOGIQUE ou TEMPS_ECOULE).
+    """
+    partie = Partie(duree)
+    maintenant = 0.0
+    partie.choisir_recette(recette or rng.choice(list(RECETTES)), maintenant)
+    recette = RECETTES[partie.recette]
+    requis = recette["ingredients_requis"]
+    aide = False
+
+    while partie.etape == SELECTION:
+        choix = requis if aide else rng.sample(TOUS_INGREDIENTS, len(requis))
+        for ingredient in choix:
+            partie.basculer_ingredient(ingredient)
+        maintenant += secondes_par_action
+        if partie.verifier_temps(maintenant):
+            return partie
+        partie.valider_ingredients()
+        aide = aide or partie.prendre_aide_ingredients()
+
+    partie.terminer_petrissage()
+    aide = False
+    while partie.etape in (CUISSON, RESULTAT):
+        if aide:
+            # La fenêtre d'aide affiche les réglages idéaux
+            partie.regler_cuisson(recette["temperature_ideale"], recette["temps_ideal"])
+        else:
+            # rng.random() est bien plus rapide que randrange dans cette boucle
+            partie.regler_cuisson(100 + 10 * int(rng.random() * 21), 1 + int(rng.random() * 60))
+        maintenant += secondes_par_action
+        if partie.verifier_temps(maintenant):
+            return partie
+        if partie.lancer_cuisson()["succes"]:
+            partie.afficher_bilan()
+        else:
+            partie.reessayer_cuisson()
+            aide = aide or partie.prendre_aide_cuisson()
+    return partie
@@ -5,20 +5,63 @@ Classe principale du jeu Boulange
 Gère l'état global, les couleurs, le timer et les transitions entre écrans
 """
 
-import pygame
+import math
 import time
+import pygame
+from assets import gestionnaire_assets, variantes_demarrage, variantes_recette
+from core import DUREE_PARTIE, TEMPS_ECOULE, Partie
+from horloge import HorlogeSimulation
+from planificateur import Planificateur
+from polices import obtenir_police
+from profileur import ProfileurImages
 from recipes import RECETTES
-from screens.accueil import EcranAccueil
-from screens.selection_ingredients import EcranSelectionIngredients
-from screens.petrissage import EcranPetrissage
-from screens.cuisson import EcranCuisson
-from screens.resultat import EcranResultat
-from screens.pedagogique import EcranPedagogique
+from traces import installer_signal_export, tampon_traces, tracer
+from ui_components import (
+    accepte_evenement, cache_textes, fusionner_mouvements, rendre_texte, signaler_zone, zones_modifiees
+)
+from screens.chargement import EcranChargement
+from screens.registre import RegistreEcrans
+
+
+def _vers_partie(attribut):
+    """Attribut de Game qui lit et écrit l'état de la partie (core.Partie)"""
+    return property(
+        lambda self: getattr(self.partie, attribut),
+        lambda self, valeur: setattr(self.partie, attribut, valeur),
+    )
 
 
 class Game:
     """Classe principale du jeu"""
 
+    # L'état du parcours vit dans self.partie (sans pygame) ; ces noms restent
+    # ceux qu'utilisent les écrans
+    recette_choisie = _vers_partie("recette")
+    ingredients_selectionnes = _vers_partie("ingredients")
+    temperature_choisie = _vers_partie("temperature")
+    temps_choisi = _vers_partie("temps")
+    compteur_erreurs = _vers_partie("erreurs_ingredients")
+    resultat_cuisson = _vers_partie("resultat")
+    aide_cuisson_pending = _vers_partie("aide_cuisson")
+    start_time = _vers_partie("debut")
+    temps_final = _vers_partie("temps_final")  # Temps pris pour réussir
+
+    # Types d'événements consommés par le jeu et ses écrans : les autres sont
+    # bloqués dès la file SDL (pygame.event.set_allowed)
+    EVENEMENTS_AUTORISES = (
+        pygame.QUIT,
+        pygame.VIDEOEXPOSE,
+        pygame.WINDOWEXPOSED,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.KEYDOWN,
+    )
+
+    # Attente maximale du mode veille (secondes)
+    ATTENTE_MAX = 0.5
+
     COULEURS = {
         'blanc': (255, 255, 255),
         'noir': (0, 0, 0),
@@ -33,55 +76,78 @@ class Game:
         'gris_clair': (211, 211, 211)
     }
 
-    def __init__(self):
+    def __init__(self, horloge_simulation=None, hors_ecran=False):
         pygame.init()
         self.largeur = 1000
         self.hauteur = 700
-        self.ecran = pygame.display.set_mode((self.largeur, self.hauteur))
-        pygame.display.set_caption("Boulange - Jeu de Boulangerie Interactif")
+        # Hors écran (mode sans affichage) : les images sont rendues dans une surface
+        # en mémoire et ne sont jamais envoyées à une fenêtre
+        self.hors_ecran = hors_ecran
+        if hors_ecran:
+            self.ecran = pygame.Surface((self.largeur, self.hauteur))
+        else:
+            self.ecran = pygame.display.set_mode((self.largeur, self.hauteur))
+            pygame.display.set_caption("Boulange - Jeu de Boulangerie Interactif")
+
+        # Filtrage des événements à la source
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.EVENEMENTS_AUTORISES))
 
         self.horloge = pygame.time.Clock()
         self.fps = 60
         self.en_cours = True
 
+        # Rendu partiel : seules les zones signalées sont redessinées et envoyées à l'écran
+        # (pour les écrans qui déclarent rendu_partiel = True)
+        self.rendu_partiel = True
+        self._texte_timer_affiche = None
+
+        # Mode veille : quand rien n'est animé, la boucle dort dans pygame.event.wait
+        # jusqu'au prochain événement ou à la prochaine échéance (seconde du timer, etc.)
+        self.mode_veille = True
+
+        # Profileur d'images (F3) : surcouche FPS / temps par phase, inactif par défaut
+        self.profileur = ProfileurImages()
+
+        # Traces : tampon circulaire exporté au format Chrome par F4 ou SIGUSR1
+        installer_signal_export()
+
         # --- Gestion du temps ---
-        self.timer_total = 300  # 5 minutes
-        self.start_time = None
-        self.time_up = False
-        self.temps_final = None  # Temps pris pour réussir
+        # Horloge du jeu (temps réel par défaut ; simulée pour les exécutions automatiques)
+        self.horloge_simulation = horloge_simulation or HorlogeSimulation()
+        # Toutes les échéances (secondes du timer, fin de partie, aides, transitions)
+        # passent par ce planificateur, sur l'horloge du jeu
+        self.planificateur = Planificateur(self.horloge_simulation.maintenant)
+        self.timer_total = DUREE_PARTIE  # 5 minutes
 
         # --- État du jeu ---
-        self.ecran_actuel = "accueil"
-        self.recette_choisie = None
-        self.ingredients_selectionnes = []
-        self.temperature_choisie = 180
-        self.temps_choisi = 20
-        self.compteur_erreurs = 0
-        self.resultat_cuisson = None
-        self.aide_cuisson_pending = False
+        self.partie = Partie(self.timer_total)
+        self.ecran_actuel = "chargement"
         self.transition_vers_pedagogique = None
 
-        # --- Page temps écoulé ---
-        self.afficher_page_temps_ecoule = False
+        # Importe en arrière-plan l'écran qui suit probablement l'écran courant
+        self.prechauffage_ecrans = True
+
+        # --- Polices (chemins résolus une seule fois, mis en cache sur disque) ---
+        self.police_titre = obtenir_police("arial", 48)
+        self.police_normale = obtenir_police("arial", 32)
+        self.police_petite = obtenir_police("arial", 24)
+        self.police_profileur = obtenir_police("arial", 16)
 
-        # --- Polices ---
-        self.police_titre = pygame.font.SysFont("arial", 48)
-        self.police_normale = pygame.font.SysFont("arial", 32)
-        self.police_petite = pygame.font.SysFont("arial", 24)
+        # --- Préchargement des images ---
+        # L'écran de chargement ouvre l'accueil une fois les images des premiers
+        # écrans décodées ; celles de résultat d'une recette sont préchargées quand
+        # elle est choisie (le démarrage ne dépend pas de la taille du catalogue).
+        futurs = gestionnaire_assets.precharger(variantes_demarrage())
 
         # --- Initialisation des écrans ---
         self._initialiser_ecrans()
+        self.ecrans.ajouter('chargement', EcranChargement(self, futurs))
+        self.ecrans.prechauffer('accueil')
 
     def _initialiser_ecrans(self):
-        """Initialise tous les écrans"""
-        self.ecrans = {
-            'accueil': EcranAccueil(self),
-            'selection_ingredients': EcranSelectionIngredients(self),
-            'petrissage': EcranPetrissage(self),
-            'cuisson': EcranCuisson(self),
-            'resultat': EcranResultat(self),
-            'pedagogique': EcranPedagogique(self)
-        }
+        """Déclare les écrans : chacun est importé et construit à sa première utilisation"""
+        self.ecrans = RegistreEcrans(self)
 
     # --------------------------
     # NAVIGATION ET ÉTATS
@@ -89,64 +155,111 @@ class Game:
 
     def changer_ecran(self, nouvel_ecran):
         """Change d’écran"""
-        if nouvel_ecran in self.ecrans:
+        if nouvel_ecran not in self.ecrans:
+            return
+        with tracer(f"changer_ecran {nouvel_ecran}", "ecrans"):
+            # Les échéances de l'écran quitté n'ont plus lieu d'être
+            if self.ecrans.est_construit(self.ecran_actuel):
+                self.planificateur.annuler_groupe(self.ecrans[self.ecran_actuel])
             self.ecran_actuel = nouvel_ecran
+            zones_modifiees.tout()
             if hasattr(self.ecrans[nouvel_ecran], "reinitialiser"):
-                self.ecrans[nouvel_ecran].reinitialiser()
+                with tracer(f"reinitialiser {nouvel_ecran}", "ecrans"):
+                    self.ecrans[nouvel_ecran].reinitialiser()
+            if self.prechauffage_ecrans:
+                self.ecrans.prechauffer_suivant(nouvel_ecran)
+
+    def suivre_partie(self):
+        """Affiche l'écran de l'étape courante de la partie"""
+        if self.partie.etape != TEMPS_ECOULE:
+            self.changer_ecran(self.partie.etape)
+
+    @property
+    def afficher_page_temps_ecoule(self):
+        return self.partie.etape == TEMPS_ECOULE
 
     def choisir_recette(self, nom_recette):
         """Quand une recette est choisie, on démarre le timer"""
-        if nom_recette in RECETTES:
-            self.recette_choisie = nom_recette
-            self.ingredients_selectionnes = []
-            self.compteur_erreurs = 0
-            self.start_time = time.monotonic()  # 🟢 Le timer démarre ici
-            self.time_up = False
-            self.temps_final = None
-            self.changer_ecran('selection_ingredients')
+        if self.partie.choisir_recette(nom_recette, self.planificateur.maintenant()):
+            gestionnaire_assets.precharger(variantes_recette(nom_recette))
+            self.demarrer_timer()  # 🟢 Le timer démarre ici
+            self.suivre_partie()
 
     def reinitialiser_jeu(self):
         """Redémarre le jeu depuis le début"""
-        self.recette_choisie = None
-        self.ingredients_selectionnes = []
-        self.temperature_choisie = 180
-        self.temps_choisi = 20
-        self.compteur_erreurs = 0
-        self.start_time = None
-        self.time_up = False
-        self.afficher_page_temps_ecoule = False
+        self.partie.recommencer()
+        self.planificateur.annuler_groupe("timer")
+        self.planificateur.annuler(self.transition_vers_pedagogique)
         self.transition_vers_pedagogique = None
-        self.temps_final = None
-        self.changer_ecran('accueil')
+        self._suivre_timer()
+        self.suivre_partie()
+
+    def planifier_bilan(self, delai):
+        """Ouvre la page pédagogique dans `delai` secondes (annulé si le jeu redémarre)"""
+        self.planificateur.annuler(self.transition_vers_pedagogique)
+        self.transition_vers_pedagogique = self.planificateur.planifier(delai, self._afficher_bilan)
+
+    def _afficher_bilan(self):
+        self.transition_vers_pedagogique = None
+        self.partie.afficher_bilan()
+        self.suivre_partie()
 
     # --------------------------
     # GESTION DU TIMER
     # --------------------------
 
+    def demarrer_timer(self):
+        """Planifie le timer de la partie : une échéance par seconde affichée, une pour la fin"""
+        self.planificateur.annuler_groupe("timer")
+        self.planificateur.planifier(1, self._suivre_timer, periode=1, groupe="timer")
+        self.planificateur.planifier(self.timer_total, self._temps_ecoule, groupe="timer")
+        self._suivre_timer()
+
+    def _temps_ecoule(self):
+        # Fin de la partie : plus rien de planifié ne doit faire avancer le parcours
+        self.planificateur.annuler_groupe("timer")
+        self.planificateur.annuler_groupe(self.ecrans[self.ecran_actuel])
+        self.planificateur.annuler(self.transition_vers_pedagogique)
+        self.transition_vers_pedagogique = None
+        self.partie.expirer()
+        self._suivre_timer()
+        zones_modifiees.tout()
+
     def temps_restant(self):
         """Retourne le temps restant en secondes"""
-        if not self.start_time:
-            return self.timer_total
-        elapsed = int(time.monotonic() - self.start_time)
-        return max(0, self.timer_total - elapsed)
+        return self.partie.temps_restant(self.planificateur.maintenant())
 
-    def dessiner_timer(self, surface):
-        """Affiche juste le temps restant (sans texte)"""
+    def _texte_timer(self):
         restant = self.temps_restant()
         minutes = restant // 60
         secondes = restant % 60
-        texte = f"{minutes:02d}:{secondes:02d}"
-        txt_surface = self.police_normale.render(texte, True, self.COULEURS['noir'])
+        return f"{minutes:02d}:{secondes:02d}"
+
+    def dessiner_timer(self, surface):
+        """Affiche juste le temps restant (sans texte)"""
+        texte = self._texte_timer()
+        txt_surface = rendre_texte(self.police_normale, texte, True, self.COULEURS['noir'])
         bg_rect = txt_surface.get_rect(topright=(self.largeur - 30, 20))
         pygame.draw.rect(surface, self.COULEURS['blanc'], bg_rect.inflate(20, 10))
         surface.blit(txt_surface, bg_rect)
 
+    def _suivre_timer(self):
+        """Signale la zone du timer quand ses chiffres changent"""
+        texte = self._texte_timer() if self.start_time is not None else None
+        if texte == self._texte_timer_affiche:
+            return
+        for ancien_ou_nouveau in (self._texte_timer_affiche, texte):
+            if ancien_ou_nouveau:
+                txt_surface = rendre_texte(self.police_normale, ancien_ou_nouveau, True, self.COULEURS['noir'])
+                signaler_zone(txt_surface.get_rect(topright=(self.largeur - 30, 20)).inflate(20, 10))
+        self._texte_timer_affiche = texte
+
     def arreter_timer(self):
         """Stoppe le timer et enregistre le temps total écoulé"""
-        if self.start_time:
-            elapsed = int(time.monotonic() - self.start_time)
-            self.temps_final = elapsed
-            self.start_time = None
+        if self.start_time is not None:
+            self.partie.arreter_chrono(self.planificateur.maintenant())
+            self.planificateur.annuler_groupe("timer")
+            self._suivre_timer()
 
     # --------------------------
     # BOUCLE DU JEU
@@ -155,39 +268,163 @@ class Game:
     def executer(self):
         """Boucle principale"""
         while self.en_cours:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.en_cours = False
-                elif self.afficher_page_temps_ecoule:
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        self.reinitialiser_jeu()
-                else:
-                    self.ecrans[self.ecran_actuel].gerer_evenement(event)
-
-            if not self.afficher_page_temps_ecoule:
-                self.ecrans[self.ecran_actuel].mettre_a_jour()
-
-            # Transition automatique vers la page pédagogique après 10s
-            if self.transition_vers_pedagogique and time.time() >= self.transition_vers_pedagogique:
-                self.transition_vers_pedagogique = None
-                self.changer_ecran("pedagogique")
-
-            # Temps écoulé
-            if self.start_time and self.temps_restant() <= 0:
-                self.start_time = None
-                self.afficher_page_temps_ecoule = True
-
-            # --- Rendu ---
-            if self.afficher_page_temps_ecoule:
-                self.afficher_temps_ecoule()
+            self.executer_image()
+
+    def executer_image(self):
+        """Un tour de boucle : événements, échéances, mise à jour puis rendu d'une image"""
+        debut_attente = time.perf_counter()
+        evenements = self._attendre_evenements()
+        debut_image = time.perf_counter()
+        tampon_traces.ajouter("attente", "boucle", debut_attente, debut_image)
+        profileur = self.profileur if self.profileur.actif else None
+        if profileur:
+            # L'attente de la veille n'est pas comptée : le chrono part d'ici
+            profileur.debut_image()
+
+        for event in evenements:
+            if event.type == pygame.QUIT:
+                self.en_cours = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                zones_modifiees.tout()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profileur.basculer()
+                zones_modifiees.tout()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                tampon_traces.exporter()
+            elif self.afficher_page_temps_ecoule:
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    self.reinitialiser_jeu()
             else:
-                self.ecran.fill(self.COULEURS['beige'])
-                self.ecrans[self.ecran_actuel].dessiner(self.ecran)
-                if self.start_time:
-                    self.dessiner_timer(self.ecran)
+                ecran_actif = self.ecrans[self.ecran_actuel]
+                if accepte_evenement(ecran_actif, event):
+                    ecran_actif.gerer_evenement(event)
+
+        if profileur:
+            profileur.marquer("evenements")
+
+        # Échéances arrivées (timer, fin de partie, aides, transitions automatiques)
+        self.planificateur.executer_echues()
+
+        if not self.afficher_page_temps_ecoule:
+            self.ecrans[self.ecran_actuel].mettre_a_jour()
+
+        # Images finies de décoder en arrière-plan
+        gestionnaire_assets.integrer_termines()
+        if profileur:
+            profileur.marquer("mise_a_jour")
+
+        # --- Rendu ---
+        with tracer("rendu", "boucle"):
+            self._rendre(profileur)
+        if profileur:
+            profileur.fin_image(self.ecran_actuel)
+        tampon_traces.ajouter("image", "boucle", debut_image, time.perf_counter(), {"ecran": self.ecran_actuel})
+        self.horloge_simulation.fin_image(self.horloge, self.fps)
+
+    # --------------------------
+    # MODE VEILLE
+    # --------------------------
 
+    def _delai_avant_prochaine_image(self):
+        """
+        Secondes avant que l'image doive changer sans intervention de l'utilisateur :
+        0 s'il faut une image tout de suite, None si rien n'est prévu.
+        """
+        if zones_modifiees.tout_redessiner or zones_modifiees.rects:
+            return 0
+        if self.profileur.actif:
+            return 0  # la surcouche se met à jour à chaque image
+
+        delais = []
+        if not self.afficher_page_temps_ecoule:
+            ecran_actif = self.ecrans[self.ecran_actuel]
+            if not hasattr(ecran_actif, "delai_avant_changement"):
+                return 0  # écran qui ne sait pas le dire : on garde le rythme normal
+            delais.append(ecran_actif.delai_avant_changement())
+
+        # Prochaine échéance planifiée (seconde du timer, fermeture d'aide, transition...)
+        delais.append(self.planificateur.delai_avant_prochaine())
+
+        delais = [d for d in delais if d is not None]
+        if not delais:
+            return None
+        return max(0, min(delais))
+
+    def _attendre_evenements(self):
+        """Retourne les événements en attente, en dormant d'abord si la scène est statique"""
+        if self.mode_veille:
+            delai = self._delai_avant_prochaine_image()
+            if not self.horloge_simulation.temps_reel:
+                # Horloge simulée : jamais d'attente, on saute directement à l'échéance
+                if delai:
+                    self.horloge_simulation.avancer(delai)
+            elif delai is None or delai > 0:
+                # pygame.event.wait : timeout en ms. Jamais sans limite : les signaux
+                # (SIGUSR1, export des traces) ne sont traités qu'au retour dans Python
+                delai = self.ATTENTE_MAX if delai is None else min(delai, self.ATTENTE_MAX)
+                timeout = max(1, math.ceil(delai * 1000))
+                evenement = pygame.event.wait(timeout)
+                if evenement.type != pygame.NOEVENT:
+                    return fusionner_mouvements([evenement] + pygame.event.get())
+                return []
+        return fusionner_mouvements(pygame.event.get())
+
+    def _rendre(self, profileur=None):
+        """
+        Dessine l'image courante.
+        En rendu partiel, seules les zones signalées sont redessinées (avec un clip)
+        puis envoyées avec display.update ; sans changement, rien n'est redessiné.
+        """
+        if profileur:
+            signaler_zone(profileur.rect)  # la surcouche change à chaque image
+        tout_redessiner, zones = zones_modifiees.recuperer()
+        ecran_actif = self.ecrans[self.ecran_actuel]
+        partiel = self.rendu_partiel and (
+            self.afficher_page_temps_ecoule or getattr(ecran_actif, "rendu_partiel", False)
+        )
+
+        if partiel and not tout_redessiner:
+            if not zones:
+                return
+            self.ecran.set_clip(zones[0].unionall(zones[1:]))
+            self._dessiner_image(ecran_actif)
+            self.ecran.set_clip(None)
+            self._dessiner_profileur(profileur)
+            self._presenter(zones)
+        else:
+            self._dessiner_image(ecran_actif)
+            self._dessiner_profileur(profileur)
+            self._presenter(None)
+        if profileur:
+            profileur.marquer("affichage")
+
+    def _dessiner_profileur(self, profileur):
+        """Surcouche F3, dessinée après l'image (son propre coût n'est compté dans aucune phase)"""
+        if profileur:
+            profileur.marquer("dessin")
+            profileur.dessiner(
+                self.ecran, self.police_profileur,
+                cache_textes.statistiques(), gestionnaire_assets.statistiques(),
+            )
+            profileur.ignorer()
+
+    def _presenter(self, zones):
+        """Envoie l'image à la fenêtre (les zones données, ou tout si None)"""
+        if self.hors_ecran:
+            return
+        if zones is None:
             pygame.display.flip()
-            self.horloge.tick(self.fps)
+        else:
+            pygame.display.update(zones)
+
+    def _dessiner_image(self, ecran_actif):
+        if self.afficher_page_temps_ecoule:
+            self.afficher_temps_ecoule()
+        else:
+            self.ecran.fill(self.COULEURS['beige'])
+            ecran_actif.dessiner(self.ecran)
+            if self.start_time is not None:
+                self.dessiner_timer(self.ecran)
 
     # --------------------------
     # PAGE “TEMPS ÉCOULÉ”
@@ -197,8 +434,8 @@ class Game:
         """Affiche la page spéciale temps écoulé"""
         self.ecran.fill(self.COULEURS['rouge_clair'])
 
-        titre = self.police_titre.render("⏰ Ooups ! Temps écoulé !", True, self.COULEURS['blanc'])
-        texte = self.police_normale.render("Le temps est écoulé, recommencez une nouvelle partie.", True, self.COULEURS['blanc'])
+        titre = rendre_texte(self.police_titre, "⏰ Ooups ! Temps écoulé !", True, self.COULEURS['blanc'])
+        texte = rendre_texte(self.police_normale, "Le temps est écoulé, recommencez une nouvelle partie.", True, self.COULEURS['blanc'])
         bouton = pygame.Rect(self.largeur // 2 - 100, self.hauteur // 2 + 60, 200, 50)
 
         # Centrage du texte
@@ -207,7 +444,7 @@ class Game:
 
         # Bouton “Recommencer”
         pygame.draw.rect(self.ecran, self.COULEURS['blanc'], bouton, border_radius=12)
-        label = self.police_normale.render("Recommencer", True, self.COULEURS['rouge'])
+        label = rendre_texte(self.police_normale, "Recommencer", True, self.COULEURS['rouge'])
         self.ecran.blit(label, (bouton.centerx - label.get_width() // 2, bouton.centery - label.get_height() // 2))
 
     # --------------------------
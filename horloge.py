@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Horloge de simulation du jeu Boulange
+Source unique du temps de jeu (timer, pétrissage, aides, transitions).
+Trois modes :
+- "reel"     : temps réel (horloge monotone du système)
+- "pas_fixe" : le temps avance d'un pas fixe par image, images cadencées au fps
+- "rapide"   : pas fixe sans attente entre les images (le plus vite possible)
+En mode simulé, une attente (mode veille) saute directement à l'échéance :
+une partie de 5 minutes se joue en quelques millisecondes.
+"""
+
+import time
+
+MODES = ("reel", "pas_fixe", "rapide")
+
+
+class HorlogeSimulation:
+    """Temps du jeu, réel ou simulé"""
+
+    def __init__(self, mode="reel", pas=1 / 60):
+        if mode not in MODES:
+            raise ValueError(f"Mode d'horloge inconnu : {mode!r} (attendu : {', '.join(MODES)})")
+        self.mode = mode
+        self.pas = pas
+        self._temps = 0.0  # temps simulé (secondes)
+
+    @property
+    def temps_reel(self):
+        return self.mode == "reel"
+
+    def maintenant(self):
+        """Temps courant du jeu (secondes, origine arbitraire)"""
+        if self.temps_reel:
+            return time.monotonic()
+        return self._temps
+
+    def avancer(self, secondes):
+        """Fait avancer le temps simulé (sans effet en temps réel)"""
+        if not self.temps_reel and secondes > 0:
+            self._temps += secondes
+
+    def fin_image(self, horloge, fps):
+        """Termine une image : cadence avec l'horloge pygame et/ou avance d'un pas"""
+        if self.mode == "rapide":
+            horloge.tick()  # mesure seulement, pas de limite
+        else:
+            horloge.tick(fps)
+        self.avancer(self.pas)
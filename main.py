@@ -3,27 +3,71 @@
 """
 Point d'entrée principal du jeu Boulange
 Jeu de boulangerie interactif en français
+
+    python3 main.py                                # jeu normal, dans une fenêtre
+    python3 main.py --headless --script s.json     # sans affichage, piloté par un script
 """
 
+import argparse
 import pygame
 import sys
+from assets import gestionnaire_assets
 from game import Game
+from horloge import MODES, HorlogeSimulation
+import sans_affichage
+
+
+def lire_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Boulange - Jeu de Boulangerie Interactif")
+    parser.add_argument("--headless", action="store_true",
+                        help="sans fenêtre (pilote SDL dummy, rendu dans une surface en mémoire)")
+    parser.add_argument("--script", help="script JSON d'entrées à jouer (mode --headless)")
+    parser.add_argument("--captures", help="dossier où écrire les captures PNG (mode --headless)")
+    parser.add_argument("--images", default="",
+                        help="numéros d'images à capturer, séparés par des virgules (ex. 1,60,600 ; une image = 1/60 s de jeu)")
+    parser.add_argument("--horloge", choices=MODES,
+                        help="horloge du jeu (défaut : reel, ou rapide en mode --headless)")
+    parser.add_argument("--duree", type=float, default=60,
+                        help="durée maximale en secondes de jeu (mode --headless, défaut 60)")
+    return parser.parse_args(argv)
 
 
 def main():
     """Point d'entrée principal du jeu"""
+    arguments = lire_arguments()
+    if arguments.headless:
+        sans_affichage.preparer_pilotes()
+
     # Initialisation de Pygame
     pygame.init()
+    code_sortie = 0
 
     try:
-        # Création et lancement du jeu
-        jeu = Game()
-        jeu.executer()
+        mode = arguments.horloge or ("rapide" if arguments.headless else "reel")
+        jeu = Game(HorlogeSimulation(mode), hors_ecran=arguments.headless)
+
+        if arguments.headless:
+            execution = sans_affichage.ExecutionSansAffichage(
+                jeu,
+                actions=sans_affichage.charger_script(arguments.script) if arguments.script else (),
+                dossier_captures=arguments.captures,
+                images_a_capturer=[int(n) for n in arguments.images.split(",") if n.strip()],
+                duree_max=arguments.duree,
+            )
+            images = execution.executer()
+            print(f"{images} images rendues, {len(execution.captures)} captures")
+            if execution.images_manquantes:
+                print("Images jamais rendues : " + ", ".join(map(str, execution.images_manquantes)))
+        else:
+            # Création et lancement du jeu
+            jeu.executer()
     except Exception as e:
         print(f"Erreur lors du lancement du jeu: {e}")
+        code_sortie = 1
     finally:
+        gestionnaire_assets.arreter_prechargement()
         pygame.quit()
-        sys.exit()
+        sys.exit(code_sortie)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Planificateur d'échéances du jeu Boulange
+File de priorité (tas) de rappels ponctuels ou répétés, sur une horloge
+monotone unique. La boucle principale exécute les rappels échus et peut
+dormir jusqu'à la prochaine échéance.
+"""
+
+import heapq
+import itertools
+import time
+
+
+class Tache:
+    """Rappel planifié (renvoyé par Planificateur.planifier, sert à l'annuler)"""
+
+    __slots__ = ("echeance", "rappel", "periode", "groupe", "annulee")
+
+    def __init__(self, echeance, rappel, periode, groupe):
+        self.echeance = echeance
+        self.rappel = rappel
+        self.periode = periode
+        self.groupe = groupe
+        self.annulee = False
+
+    def annuler(self):
+        self.annulee = True
+
+
+class Planificateur:
+    """Échéancier à tas sur une horloge monotone"""
+
+    def __init__(self, horloge=time.monotonic):
+        self.horloge = horloge
+        self._tas = []
+        self._rang = itertools.count()  # départage les échéances égales (ordre d'ajout)
+
+    def maintenant(self):
+        """Temps courant de l'horloge du jeu (secondes)"""
+        return self.horloge()
+
+    def planifier(self, delai, rappel, periode=None, groupe=None):
+        """
+        Appelle `rappel()` dans `delai` secondes, puis toutes les `periode` secondes si donnée.
+        `groupe` permet d'annuler d'un coup toutes les tâches d'un écran.
+        """
+        tache = Tache(self.maintenant() + delai, rappel, periode, groupe)
+        heapq.heappush(self._tas, (tache.echeance, next(self._rang), tache))
+        return tache
+
+    def annuler(self, tache):
+        """Annule une tâche (retirée du tas paresseusement)"""
+        if tache is not None:
+            tache.annuler()
+
+    def annuler_groupe(self, groupe):
+        """Annule toutes les tâches du groupe"""
+        for _, _, tache in self._tas:
+            if tache.groupe == groupe:
+                tache.annuler()
+
+    def executer_echues(self):
+        """Exécute, dans l'ordre, les rappels dont l'échéance est passée"""
+        maintenant = self.maintenant()
+        while self._tas and self._tas[0][0] <= maintenant:
+            _, _, tache = heapq.heappop(self._tas)
+            if tache.annulee:
+                continue
+            if tache.periode:
+                # Pas de rattrapage en rafale si la boucle a pris du retard
+                while tache.echeance <= maintenant:
+                    tache.echeance += tache.periode
+                heapq.heappush(self._tas, (tache.echeance, next(self._rang), tache))
+            tache.rappel()
+
+    def prochaine_echeance(self):
+        """Échéance de la prochaine tâche active, ou None"""
+        while self._tas and self._tas[0][2].annulee:
+            heapq.heappop(self._tas)
+        return self._tas[0][0] if self._tas else None
+
+    def delai_avant_prochaine(self):
+        """Secondes avant la prochaine tâche (0 si déjà échue), ou None"""
+        echeance = self.prochaine_echeance()
+        if echeance is None:
+            return None
+        return max(0, echeance - self.maintenant())
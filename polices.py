@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gestionnaire de polices pour le jeu Boulange
+Résout une seule fois le fichier de chaque famille de polices système
+(la recherche passe par fc-list sous Linux), mémorise le résultat sur disque
+pour les lancements suivants et partage les objets Font par (famille, taille).
+"""
+
+import json
+import os
+
+import pygame
+
+
+def _chemin_cache_par_defaut():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "boulange", "polices.json")
+
+
+class GestionnairePolices:
+    """Polices partagées, avec cache disque des chemins résolus"""
+
+    def __init__(self, chemin_cache=None):
+        self.chemin_cache = chemin_cache or _chemin_cache_par_defaut()
+        self._chemins = None        # famille -> chemin du fichier résolu
+        self._introuvables = set()  # familles introuvables pendant ce lancement (jamais sur disque)
+        self._polices = {}          # (famille, taille) -> pygame.font.Font
+
+    # --------------------------
+    # RÉSOLUTION DES FAMILLES
+    # --------------------------
+
+    def _charger_cache(self):
+        if self._chemins is None:
+            try:
+                with open(self.chemin_cache, encoding="utf-8") as f:
+                    # Les échecs (None) d'anciennes versions du cache sont ignorés
+                    self._chemins = {famille: chemin for famille, chemin in json.load(f).items() if chemin}
+            except (OSError, ValueError, AttributeError):
+                self._chemins = {}
+        return self._chemins
+
+    def _sauver_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.chemin_cache), exist_ok=True)
+            provisoire = self.chemin_cache + ".tmp"
+            with open(provisoire, "w", encoding="utf-8") as f:
+                json.dump(self._chemins, f, ensure_ascii=False, indent=2)
+            os.replace(provisoire, self.chemin_cache)
+        except OSError:
+            pass  # cache facultatif : on résoudra de nouveau au prochain lancement
+
+    def chemin_police(self, famille):
+        """Chemin du fichier de la famille, ou None pour la police par défaut de pygame"""
+        if famille is None:
+            return None
+        chemins = self._charger_cache()
+        chemin = chemins.get(famille)
+        if chemin is not None and os.path.exists(chemin):
+            return chemin
+        if famille in self._introuvables:
+            return None
+        chemin = pygame.font.match_font(famille)
+        if chemin is None:
+            # Échec gardé pour ce lancement seulement : la police peut être installée plus tard
+            self._introuvables.add(famille)
+            return None
+        chemins[famille] = chemin
+        self._sauver_cache()
+        return chemin
+
+    # --------------------------
+    # POLICES PARTAGÉES
+    # --------------------------
+
+    def obtenir(self, famille, taille):
+        """Retourne l'objet Font partagé pour (famille, taille)"""
+        cle = (famille, taille)
+        police = self._polices.get(cle)
+        if police is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            police = pygame.font.Font(self.chemin_police(famille), taille)
+            self._polices[cle] = police
+        return police
+
+
+# Instance partagée par le jeu et les composants
+gestionnaire_polices = GestionnairePolices()
+
+
+def obtenir_police(famille, taille):
+    """Fonction utilitaire : police depuis le gestionnaire partagé"""
+    return gestionnaire_polices.obtenir(famille, taille)
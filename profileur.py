@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profileur d'images du jeu Boulange (surcouche F3)
+Mesure, image par image, le temps passé dans les événements, la mise à jour,
+le dessin et l'envoi à l'écran, par écran actif, et l'affiche par-dessus le jeu
+avec la courbe des dernières images et les taux de succès des caches.
+Désactivé, il ne coûte rien : la boucle ne l'appelle pas.
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+PHASES = ("evenements", "mise_a_jour", "dessin", "affichage")
+LIBELLES = {"evenements": "évén.", "mise_a_jour": "màj", "dessin": "dessin", "affichage": "écran"}
+
+
+class ProfileurImages:
+    """Chronomètre les phases de chaque image et dessine la surcouche"""
+
+    def __init__(self, nb_images=120):
+        self.actif = False
+        self.durees_images = deque(maxlen=nb_images)  # durée totale des dernières images (s)
+        self.par_ecran = {}                           # écran -> [images, somme par phase...]
+        self._debut_image = None
+        self._top = 0.0
+        self._phases = dict.fromkeys(PHASES, 0.0)
+        self.rect = pygame.Rect(10, 10, 360, 0)  # hauteur fixée au premier dessin
+
+    def basculer(self):
+        """Active / désactive le profileur (les mesures repartent de zéro)"""
+        self.actif = not self.actif
+        self.durees_images.clear()
+        self.par_ecran.clear()
+        self._debut_image = None
+
+    # --------------------------
+    # MESURES (appelées par la boucle seulement quand actif)
+    # --------------------------
+
+    def debut_image(self):
+        maintenant = time.perf_counter()
+        if self._debut_image is not None:
+            self.durees_images.append(maintenant - self._debut_image)
+        self._debut_image = maintenant
+        self._top = maintenant
+        for phase in PHASES:
+            self._phases[phase] = 0.0
+
+    def marquer(self, phase):
+        """Attribue à `phase` le temps écoulé depuis la marque précédente"""
+        maintenant = time.perf_counter()
+        self._phases[phase] += maintenant - self._top
+        self._top = maintenant
+
+    def ignorer(self):
+        """Le temps écoulé depuis la marque précédente n'est attribué à aucune phase"""
+        self._top = time.perf_counter()
+
+    def fin_image(self, nom_ecran):
+        cumul = self.par_ecran.setdefault(nom_ecran, [0] + [0.0] * len(PHASES))
+        cumul[0] += 1
+        for i, phase in enumerate(PHASES, start=1):
+            cumul[i] += self._phases[phase]
+
+    def fps(self):
+        if not self.durees_images:
+            return 0.0
+        return len(self.durees_images) / sum(self.durees_images)
+
+    # --------------------------
+    # SURCOUCHE
+    # --------------------------
+
+    def _lignes(self, statistiques_textes, statistiques_assets):
+        """Lignes de la surcouche ; chaque ligne est une liste de cellules (colonnes fixes)"""
+        derniere = self.durees_images[-1] * 1000 if self.durees_images else 0.0
+        lignes = [[f"FPS {self.fps():.1f}   image {derniere:.1f} ms"]]
+        lignes.append(["ms / image"] + [LIBELLES[p] for p in PHASES])
+        for nom, cumul in self.par_ecran.items():
+            images = cumul[0]
+            lignes.append([nom] + [f"{cumul[i] / images * 1000:.2f}" for i in range(1, len(PHASES) + 1)])
+        lignes.append([
+            f"cache textes {statistiques_textes['taux_succes']:.0%}"
+            f"   images {statistiques_assets['taux_succes']:.0%}"
+        ])
+        return lignes
+
+    def dessiner(self, surface, police, statistiques_textes, statistiques_assets):
+        """Dessine la surcouche en haut à gauche (textes rendus sans passer par le cache)"""
+        lignes = self._lignes(statistiques_textes, statistiques_assets)
+        hauteur_ligne = police.get_linesize()
+        hauteur_courbe = 50
+        self.rect.height = 10 + hauteur_ligne * len(lignes) + hauteur_courbe + 10
+
+        fond = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        fond.fill((0, 0, 0, 180))
+        surface.blit(fond, self.rect)
+
+        # Première cellule à gauche, les suivantes alignées à droite de colonnes de 55 px
+        y = self.rect.y + 5
+        for cellules in lignes:
+            surface.blit(police.render(cellules[0], True, (255, 255, 255)), (self.rect.x + 8, y))
+            for i, cellule in enumerate(cellules[1:], start=1):
+                rendu = police.render(cellule, True, (255, 255, 255))
+                droite = self.rect.x + 130 + i * 55
+                surface.blit(rendu, (droite - rendu.get_width(), y))
+            y += hauteur_ligne
+
+        # Courbe des durées d'image : repère à 1/60 s, barres rouges au-delà
+        bas = self.rect.bottom - 8
+        echelle = hauteur_courbe / (2 / 60)  # la hauteur représente 33 ms
+        repere = bas - int(echelle / 60)
+        pygame.draw.line(surface, (120, 120, 120), (self.rect.x + 8, repere), (self.rect.right - 8, repere))
+        for i, duree in enumerate(self.durees_images):
+            x = self.rect.x + 8 + i * (self.rect.width - 16) // self.durees_images.maxlen
+            hauteur = min(hauteur_courbe, int(duree * echelle))
+            couleur = (80, 200, 80) if duree <= 1 / 55 else (230, 60, 60)
+            pygame.draw.line(surface, couleur, (x, bas), (x, bas - hauteur))
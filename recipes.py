@@ -1,69 +1,127 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-TOUS_INGREDIENTS = [
-    "farine",
-    "sucre",
-    "beurre",
-    "œuf",
-    "lait",
-    "levure",
-    "eau",
-    "sel",
-    "chocolat",
-    "miel",
-]
-
-RECETTES = {
-    "pain": {
-        "nom": "Pain",
-        "ingredients_requis": ["farine", "eau", "sel", "levure"],
-        "temperature_ideale": 220,
-        "tolerance_temp": 10,
-        "temps_ideal": 25,
-        "tolerance_temps": 5,
-        "images": {
-            "base": "pain.png",
-            "reussie": "pain_reussi.png",
-            "cru": "pain_cru.png",
-            "brule": "pain_brule.png",
-        },
-    },
-    "croissant": {
-        "nom": "Croissant",
-        "ingredients_requis": ["farine", "beurre", "levure", "sucre", "lait", "sel"],
-        "temperature_ideale": 200,
-        "tolerance_temp": 10,
-        "temps_ideal": 20,
-        "tolerance_temps": 4,
-        "images": {
-            "base": "croissant.png",
-            "reussie": "croissant_reussi.png",
-            "cru": "croissant_cru.png",
-            "brule": "croissant_brule.png",
-        },
-    },
-    "gateau": {
-        "nom": "Gâteau",
-        "ingredients_requis": ["farine", "sucre", "œuf", "lait", "beurre"],
-        "temperature_ideale": 180,
-        "tolerance_temp": 10,
-        "temps_ideal": 35,
-        "tolerance_temps": 5,
-        "images": {
-            "base": "gateau.png",
-            "reussie": "gateau_reussi.png",
-            "cru": "gateau_cru.png",
-            "brule": "gateau_brule.png",
-        },
-    },
-}
+from itertools import islice
+
+from catalogue import charger_catalogue
+
+# Ingrédients et recettes du catalogue (donnees/recettes.json, voir catalogue.py) ;
+# RECETTES décode chaque recette à sa première lecture
+TOUS_INGREDIENTS, RECETTES = charger_catalogue()
+
+# Recettes proposées sur l'écran d'accueil (seules leurs images sont préchargées au démarrage) :
+# la liste « accueil » du catalogue, sinon les premières recettes dans l'ordre du catalogue
+PLACES_ACCUEIL = 3
+RECETTES_ACCUEIL = tuple(islice(RECETTES.accueil or RECETTES, PLACES_ACCUEIL))
+
+
+# --------------------------
+# INGRÉDIENTS (masques de bits)
+# --------------------------
+
+# Chaque ingrédient est un bit ; une sélection est un entier (OU des bits)
+BITS_INGREDIENTS = {}
+# Recettes compilées : nom -> masque des ingrédients requis (rempli au premier usage)
+MASQUES_RECETTES = {}
+# Index inversé : masque des ingrédients requis -> noms des recettes (construit au premier usage)
+_recettes_par_masque = {}
+
+
+def compiler_recettes():
+    """
+    (Re)calcule les bits des ingrédients et oublie les masques et l'index inversé, qui
+    seront recalculés à la demande. Appelée au chargement ; à rappeler si
+    TOUS_INGREDIENTS ou RECETTES changent.
+    """
+    BITS_INGREDIENTS.clear()
+    BITS_INGREDIENTS.update((nom, 1 << i) for i, nom in enumerate(TOUS_INGREDIENTS))
+    MASQUES_RECETTES.clear()
+    _recettes_par_masque.clear()
+
+
+def _masque_recette(recette_nom):
+    masque = MASQUES_RECETTES.get(recette_nom)
+    if masque is None:
+        masque = MASQUES_RECETTES[recette_nom] = masque_ingredients(RECETTES[recette_nom]["ingredients_requis"])
+    return masque
+
+
+def _index_par_masque():
+    """Index inversé ; le premier appel lit toutes les recettes du catalogue"""
+    if not _recettes_par_masque:
+        for nom in RECETTES:
+            _recettes_par_masque.setdefault(_masque_recette(nom), []).append(nom)
+    return _recettes_par_masque
+
+
+def masque_ingredients(ingredients, ignorer_inconnus=False):
+    """
+    Masque d'une liste de noms d'ingrédients (un masque est renvoyé tel quel).
+    Un nom inconnu n'a pas de bit : le résultat est alors None, sauf avec
+    `ignorer_inconnus` où ce nom est simplement laissé de côté.
+    """
+    if isinstance(ingredients, int):
+        return ingredients
+    masque = 0
+    for nom in ingredients:
+        bit = BITS_INGREDIENTS.get(nom)
+        if bit is None:
+            if not ignorer_inconnus:
+                return None
+        else:
+            masque |= bit
+    return masque
+
+
+def ingredients_du_masque(masque):
+    """Noms des ingrédients d'un masque, dans l'ordre de TOUS_INGREDIENTS"""
+    return [nom for nom, bit in BITS_INGREDIENTS.items() if masque & bit]
 
 
 def valider_ingredients(recette_nom, ingredients_selectionnes):
     """Vérifie si l’ensemble des ingrédients sélectionnés correspond exactement aux requis."""
-    req = set(RECETTES[recette_nom]["ingredients_requis"])
-    return set(ingredients_selectionnes) == req
+    return masque_ingredients(ingredients_selectionnes) == _masque_recette(recette_nom)
+
+
+def recettes_exactes(ingredients_selectionnes):
+    """Recettes dont les ingrédients requis sont exactement la sélection"""
+    selection = masque_ingredients(ingredients_selectionnes)
+    if selection is None:
+        return []
+    return list(_index_par_masque().get(selection, ()))
+
+
+def recettes_realisables(ingredients_selectionnes):
+    """
+    Recettes dont tous les ingrédients requis sont dans la sélection. On parcourt
+    les sous-ensembles de la sélection dans l'index, ou les masques de l'index
+    s'ils sont moins nombreux : le coût reste borné quelle que soit la taille du catalogue.
+    Les ingrédients inconnus de la sélection sont ignorés.
+    """
+    selection = masque_ingredients(ingredients_selectionnes, ignorer_inconnus=True)
+    index = _index_par_masque()
+    recettes = []
+    if 2 ** bin(selection).count("1") > len(index):
+        for masque, noms in index.items():
+            if not masque & ~selection:
+                recettes.extend(noms)
+        return recettes
+    sous_masque = selection
+    while True:
+        recettes.extend(index.get(sous_masque, ()))
+        if not sous_masque:
+            return recettes
+        sous_masque = (sous_masque - 1) & selection
+
+
+def ecart_ingredients(recette_nom, ingredients_selectionnes):
+    """
+    (manquants, en trop) : masques des ingrédients à ajouter et à retirer
+    (un ingrédient inconnu, sans bit, n'apparaît pas dans « en trop »)
+    """
+    selection = masque_ingredients(ingredients_selectionnes, ignorer_inconnus=True)
+    requis = _masque_recette(recette_nom)
+    return requis & ~selection, selection & ~requis
 
 
 def obtenir_aide_ingredients(recette_nom, ingredients_selectionnes=None):
@@ -76,19 +134,77 @@ def obtenir_aide_ingredients(recette_nom, ingredients_selectionnes=None):
     return sorted(requis)
 
 
+compiler_recettes()
 
 
-def valider_cuisson(recette_nom, temperature, temps):
-    """Valide la cuisson et renvoie succès/échec + message + image_statut + image_path."""
-    r = RECETTES[recette_nom]
-    t0, tol_t = r["temperature_ideale"], r["tolerance_temp"]
-    d0, tol_d = r["temps_ideal"], r["tolerance_temps"]
+# --------------------------
+# CUISSON
+# --------------------------
+
+# Codes de résultat (évaluation par lots)
+REUSSIE, CRU, BRULE = 0, 1, 2
+STATUTS = ("reussie", "cru", "brule")
+
+# Raisons, dans l'ordre où elles sont vérifiées : (code, détail affiché)
+RAISONS = (
+    (REUSSIE, None),
+    (BRULE, "Trop chaud → brûlé."),
+    (CRU, "Pas assez chaud → cru."),
+    (BRULE, "Trop longtemps → trop cuit."),
+    (CRU, "Pas assez longtemps → pas assez cuit."),
+)
+
+# NumPy, importé à la première évaluation par lots (False : pas encore cherché)
+_numpy = False
+
+
+def _importer_numpy():
+    """Module numpy, ou None s'il n'est pas installé (valider_cuissons passe alors en Python pur)"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+# Identifiant numérique de chaque recette (indice dans cet ordre)
+ORDRE_RECETTES = tuple(RECETTES)
+
+
+def _reglages_ideaux(r):
+    """(température idéale, tolérance, durée idéale, tolérance) d'une recette"""
+    return r["temperature_ideale"], r["tolerance_temp"], r["temps_ideal"], r["tolerance_temps"]
+
+
+def _raison_cuisson(reglages, temperature, temps):
+    """Indice dans RAISONS du résultat d'une cuisson (reglages : voir _reglages_ideaux)"""
+    t0, tol_t, d0, tol_d = reglages
 
     ok_temp = (t0 - tol_t) <= temperature <= (t0 + tol_t)
     ok_time = (d0 - tol_d) <= temps <= (d0 + tol_d)
 
-    # ✅ Cas réussite
     if ok_temp and ok_time:
+        return 0
+    if temperature > (t0 + tol_t):
+        return 1
+    if temperature < (t0 - tol_t):
+        return 2
+    if temps > (d0 + tol_d):
+        return 3
+    return 4
+
+
+def _resultat_cuisson(recette_nom, temperature, temps, raison):
+    """Dictionnaire affiché par l'écran de résultat"""
+    r = RECETTES[recette_nom]
+    code, detail = RAISONS[raison]
+    statut = STATUTS[code]
+
+    # ✅ Cas réussite
+    if code == REUSSIE:
         fichier = r["images"]["reussie"]
         return {
             "succes": True,
@@ -98,20 +214,7 @@ def valider_cuisson(recette_nom, temperature, temps):
             "image_path": f"images/{fichier}",
         }
 
-    # ❌ Cas échec : on distingue brûlé / cru
-    if temperature > (t0 + tol_t):
-        detail = "Trop chaud → brûlé."
-        statut = "brule"
-    elif temperature < (t0 - tol_t):
-        detail = "Pas assez chaud → cru."
-        statut = "cru"
-    elif temps > (d0 + tol_d):
-        detail = "Trop longtemps → trop cuit."
-        statut = "brule"
-    else:
-        detail = "Pas assez longtemps → pas assez cuit."
-        statut = "cru"
-
+    # ❌ Cas échec : brûlé / cru
     fichier = r["images"].get(statut)
 
     return {
@@ -123,6 +226,215 @@ def valider_cuisson(recette_nom, temperature, temps):
     }
 
 
+# --------------------------
+# TABLES DE RÉSULTATS
+# --------------------------
+
+# Grille des réglages du four (compteurs de l'écran de cuisson)
+TEMPERATURE_MIN, TEMPERATURE_MAX, PAS_TEMPERATURE = 100, 300, 10
+TEMPS_MIN, TEMPS_MAX, PAS_TEMPS = 1, 60, 1
+TEMPERATURES = tuple(range(TEMPERATURE_MIN, TEMPERATURE_MAX + 1, PAS_TEMPERATURE))
+DUREES = tuple(range(TEMPS_MIN, TEMPS_MAX + 1, PAS_TEMPS))
+
+# Distance des réglages dont la réussite est hors d'atteinte sur la grille
+INACCESSIBLE = 255
+
+
+def _crans_axe(valeurs, bas, haut):
+    """Pour chaque valeur d'un axe, nombre de crans (+/-) jusqu'à la plage [bas, haut]"""
+    dans_plage = [i for i, valeur in enumerate(valeurs) if bas <= valeur <= haut]
+    if not dans_plage:
+        return [None] * len(valeurs)
+    premier, dernier = dans_plage[0], dans_plage[-1]
+    return [max(premier - i, i - dernier, 0) for i in range(len(valeurs))]
+
+
+class TableCuisson:
+    """
+    Résultat de chaque réglage de la grille pour une recette : `raisons` (indices dans
+    RAISONS) et `distances` (crans de compteur jusqu'à la réussite la plus proche),
+    une case par (température, durée), ligne par température.
+    """
+
+    __slots__ = ("reglages", "raisons", "distances")
+
+    def __init__(self, reglages):
+        self.reglages = reglages
+        t0, tol_t, d0, tol_d = reglages
+        crans_temperature = _crans_axe(TEMPERATURES, t0 - tol_t, t0 + tol_t)
+        crans_temps = _crans_axe(DUREES, d0 - tol_d, d0 + tol_d)
+
+        raisons = bytearray()
+        distances = bytearray()
+        for temperature, crans_t in zip(TEMPERATURES, crans_temperature):
+            for temps, crans_d in zip(DUREES, crans_temps):
+                raisons.append(_raison_cuisson(reglages, temperature, temps))
+                if crans_t is None or crans_d is None:
+                    distances.append(INACCESSIBLE)
+                else:
+                    distances.append(min(crans_t + crans_d, INACCESSIBLE - 1))
+        self.raisons = bytes(raisons)
+        self.distances = bytes(distances)
+
+    @staticmethod
+    def indice(temperature, temps):
+        """Case du réglage dans la table, None s'il n'est pas sur la grille"""
+        i, reste_t = divmod(temperature - TEMPERATURE_MIN, PAS_TEMPERATURE)
+        j, reste_d = divmod(temps - TEMPS_MIN, PAS_TEMPS)
+        if reste_t or reste_d or not (0 <= i < len(TEMPERATURES) and 0 <= j < len(DUREES)):
+            return None
+        return int(i) * len(DUREES) + int(j)
+
+    def raison(self, temperature, temps):
+        indice = self.indice(temperature, temps)
+        if indice is None:
+            return _raison_cuisson(self.reglages, temperature, temps)
+        return self.raisons[indice]
+
+    def distance(self, temperature, temps):
+        """Crans jusqu'à la réussite (0 si réussi), INACCESSIBLE, ou None hors grille"""
+        indice = self.indice(temperature, temps)
+        if indice is None:
+            return None
+        return self.distances[indice]
+
+
+_tables_cuisson = {}
+
+
+def table_cuisson(recette_nom):
+    """Table de la recette, recalculée si ses réglages idéaux ou ses tolérances ont changé"""
+    reglages = _reglages_ideaux(RECETTES[recette_nom])
+    table = _tables_cuisson.get(recette_nom)
+    if table is None or table.reglages != reglages:
+        table = _tables_cuisson[recette_nom] = TableCuisson(reglages)
+    return table
+
+
+def valider_cuisson(recette_nom, temperature, temps):
+    """Valide la cuisson et renvoie succès/échec + message + image_statut + image_path."""
+    raison = table_cuisson(recette_nom).raison(temperature, temps)
+    return _resultat_cuisson(recette_nom, temperature, temps, raison)
+
+
+def distance_reussite(recette_nom, temperature, temps):
+    """Nombre de crans de compteur à changer pour réussir (voir TableCuisson.distance)"""
+    return table_cuisson(recette_nom).distance(temperature, temps)
+
+
+class ResultatsCuisson:
+    """
+    Résultats d'une évaluation par lots (tableaux NumPy, ou listes sans NumPy) :
+    `codes` (REUSSIE / CRU / BRULE), `raisons` (indices dans RAISONS) et écarts signés
+    à l'idéal `ecarts_temperature` (°C) et `ecarts_temps` (min).
+    Les messages ne sont construits qu'à la demande (resultat, resultats).
+    """
+
+    __slots__ = ("recettes", "temperatures", "temps", "codes", "raisons",
+                 "ecarts_temperature", "ecarts_temps")
+
+    def __init__(self, recettes, temperatures, temps, raisons, ecarts_temperature, ecarts_temps):
+        self.recettes = recettes
+        self.temperatures = temperatures
+        self.temps = temps
+        self.raisons = raisons
+        self.ecarts_temperature = ecarts_temperature
+        self.ecarts_temps = ecarts_temps
+        np = _importer_numpy()
+        if np is not None and isinstance(raisons, np.ndarray):
+            self.codes = np.array([code for code, _ in RAISONS], dtype=np.int8)[raisons]
+        else:
+            self.codes = [RAISONS[raison][0] for raison in raisons]
+
+    def __len__(self):
+        return len(self.raisons)
+
+    @property
+    def succes(self):
+        """Masque (ou liste) des cuissons réussies"""
+        np = _importer_numpy()
+        if np is not None and isinstance(self.codes, np.ndarray):
+            return self.codes == REUSSIE
+        return [code == REUSSIE for code in self.codes]
+
+    def taux_succes(self):
+        if not len(self):
+            return 0.0
+        np = _importer_numpy()
+        if np is not None and isinstance(self.codes, np.ndarray):
+            return np.count_nonzero(self.codes == REUSSIE) / len(self)
+        return self.codes.count(REUSSIE) / len(self)
+
+    def resultat(self, i):
+        """Dictionnaire de valider_cuisson pour la i-ème combinaison (message construit ici)"""
+        if isinstance(self.recettes, str):
+            recette = self.recettes
+        else:
+            recette = ORDRE_RECETTES[int(self.recettes[i])]
+        temperature, temps = self.temperatures[i], self.temps[i]
+        np = _importer_numpy()
+        if np is not None and isinstance(temperature, np.generic):
+            temperature, temps = temperature.item(), temps.item()
+        return _resultat_cuisson(recette, temperature, temps, int(self.raisons[i]))
+
+    def resultats(self):
+        for i in range(len(self)):
+            yield self.resultat(i)
+
+
+def valider_cuissons(temperatures, temps, recettes):
+    """
+    Évalue d'un coup des combinaisons (température, durée), mêmes règles que valider_cuisson.
+    `recettes` : un nom de recette pour toutes les combinaisons, ou un tableau
+    d'identifiants (indices dans ORDRE_RECETTES). Retourne un ResultatsCuisson.
+    """
+    np = _importer_numpy()
+    if np is None:
+        return _valider_cuissons_python(temperatures, temps, recettes)
+
+    temperatures = np.asarray(temperatures)
+    temps = np.asarray(temps)
+    if temperatures.shape != temps.shape:
+        raise ValueError("temperatures et temps doivent avoir la même forme")
+
+    # Paramètres de chaque recette, puis ceux de chaque combinaison
+    parametres = np.array([_reglages_ideaux(RECETTES[nom]) for nom in ORDRE_RECETTES])
+    if isinstance(recettes, str):
+        t0, tol_t, d0, tol_d = parametres[ORDRE_RECETTES.index(recettes)]
+    else:
+        recettes = np.asarray(recettes)
+        t0, tol_t, d0, tol_d = parametres[recettes].T
+
+    # Même ordre de vérification que _raison_cuisson : la première condition vraie l'emporte
+    raisons = np.select(
+        [temperatures > t0 + tol_t, temperatures < t0 - tol_t, temps > d0 + tol_d, temps < d0 - tol_d],
+        [1, 2, 3, 4],
+        default=0,
+    ).astype(np.int8)
+    return ResultatsCuisson(recettes, temperatures, temps, raisons, temperatures - t0, temps - d0)
+
+
+def _valider_cuissons_python(temperatures, temps, recettes):
+    """Repli sans NumPy : même résultat, listes au lieu de tableaux"""
+    temperatures = list(temperatures)
+    temps = list(temps)
+    if len(temperatures) != len(temps):
+        raise ValueError("temperatures et temps doivent avoir la même longueur")
+    if isinstance(recettes, str):
+        noms = [recettes] * len(temperatures)
+    else:
+        recettes = list(recettes)
+        noms = [ORDRE_RECETTES[i] for i in recettes]
+
+    raisons, ecarts_temperature, ecarts_temps = [], [], []
+    for nom, temperature, duree in zip(noms, temperatures, temps):
+        r = RECETTES[nom]
+        raisons.append(_raison_cuisson(_reglages_ideaux(r), temperature, duree))
+        ecarts_temperature.append(temperature - r["temperature_ideale"])
+        ecarts_temps.append(duree - r["temps_ideal"])
+    return ResultatsCuisson(recettes, temperatures, temps, raisons, ecarts_temperature, ecarts_temps)
+
+
 def obtenir_parametres_cuisson(nom_recette):
     """Renvoie les paramètres de base pour initialiser les compteurs de cuisson."""
     r = RECETTES.get(nom_recette)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mode sans affichage du jeu Boulange (intégration continue, mesures, serveurs)
+Le jeu tourne avec le pilote vidéo SDL « dummy » et rend chaque image dans une
+surface en mémoire. Les entrées viennent d'un script JSON, une liste d'actions
+datées en secondes de jeu :
+
+    [
+        {"t": 1.0, "action": "clic", "pos": [500, 300]},
+        {"t": 2.0, "action": "touche", "touche": "escape"},
+        {"t": 2.5, "action": "molette", "y": -3},
+        {"t": 3.0, "action": "capture", "nom": "selection"},
+        {"t": 4.0, "action": "quitter"}
+    ]
+
+Les actions passent par le planificateur du jeu : avec une horloge simulée,
+l'attente jusqu'à la prochaine action est sautée. Si des numéros d'images sont à
+capturer, le mode veille est coupé : chaque image avance alors d'un pas (1/60 s),
+et l'image n correspond à n pas de jeu.
+"""
+
+import json
+import os
+import pygame
+
+ACTIONS = ("clic", "deplacer", "touche", "molette", "capture", "quitter")
+
+
+def preparer_pilotes():
+    """Sélectionne les pilotes SDL factices (à appeler avant pygame.init)"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def evenements_action(action):
+    """Événements pygame correspondant à une action du script"""
+    genre = action["action"]
+    if genre == "deplacer":
+        return [pygame.event.Event(pygame.MOUSEMOTION, pos=tuple(action["pos"]), rel=(0, 0), buttons=(0, 0, 0))]
+    if genre == "clic":
+        pos = tuple(action["pos"])
+        bouton = action.get("bouton", 1)
+        return [
+            pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=bouton),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=bouton),
+        ]
+    if genre == "touche":
+        touche = pygame.key.key_code(action["touche"])
+        return [pygame.event.Event(pygame.KEYDOWN, key=touche, mod=0, unicode="", scancode=0)]
+    if genre == "molette":
+        return [pygame.event.Event(pygame.MOUSEWHEEL, x=action.get("x", 0), y=action.get("y", 0), flipped=False)]
+    if genre == "quitter":
+        return [pygame.event.Event(pygame.QUIT)]
+    return []
+
+
+def charger_script(chemin):
+    """Lit et vérifie un script d'entrées JSON ; retourne les actions triées par date"""
+    with open(chemin, encoding="utf-8") as fichier:
+        actions = json.load(fichier)
+    if not isinstance(actions, list):
+        raise ValueError(f"{chemin} : le script doit être une liste d'actions")
+    for numero, action in enumerate(actions):
+        if not isinstance(action, dict) or action.get("action") not in ACTIONS:
+            raise ValueError(f"{chemin} : action n°{numero} invalide (attendu : {', '.join(ACTIONS)})")
+        if not isinstance(action.get("t", 0), (int, float)):
+            raise ValueError(f"{chemin} : action n°{numero}, « t » doit être un nombre de secondes")
+    return sorted(actions, key=lambda action: action.get("t", 0))
+
+
+class ExecutionSansAffichage:
+    """Fait tourner un jeu hors écran, piloté par un script, et enregistre des captures"""
+
+    def __init__(self, jeu, actions=(), dossier_captures=None, images_a_capturer=(), duree_max=60):
+        self.jeu = jeu
+        self.actions = list(actions)
+        self.dossier_captures = dossier_captures
+        self.images_a_capturer = set(images_a_capturer)
+        self.duree_max = duree_max
+        self.numero_image = 0
+        self.captures = []             # chemins des PNG écrits
+        self.images_manquantes = []    # images demandées jamais rendues (après executer)
+        self._captures_demandees = []  # noms des captures à faire après l'image en cours
+
+    def _programmer(self):
+        planificateur = self.jeu.planificateur
+        for action in self.actions:
+            if action["action"] == "capture":
+                nom = action.get("nom") or f"t{action.get('t', 0):07.2f}"
+                rappel = lambda nom=nom: self._captures_demandees.append(nom)
+            else:
+                rappel = lambda action=action: self._poster(action)
+            planificateur.planifier(action.get("t", 0), rappel, groupe="script")
+        if self.duree_max is not None:
+            planificateur.planifier(
+                self.duree_max, lambda: pygame.event.post(pygame.event.Event(pygame.QUIT)), groupe="script"
+            )
+
+    @staticmethod
+    def _poster(action):
+        for evenement in evenements_action(action):
+            pygame.event.post(evenement)
+
+    def _capturer(self, nom):
+        if not self.dossier_captures:
+            return
+        os.makedirs(self.dossier_captures, exist_ok=True)
+        chemin = os.path.join(self.dossier_captures, f"{nom}.png")
+        pygame.image.save(self.jeu.ecran, chemin)
+        self.captures.append(chemin)
+
+    def executer(self):
+        """Joue le script jusqu'à « quitter » ou duree_max ; retourne le nombre d'images rendues"""
+        self._programmer()
+        if self.images_a_capturer:
+            # Sauter les attentes rendrait le numéro d'image sans rapport avec le temps de jeu
+            self.jeu.mode_veille = False
+        while self.jeu.en_cours:
+            self.jeu.executer_image()
+            self.numero_image += 1
+            if self.numero_image in self.images_a_capturer:
+                self._capturer(f"image_{self.numero_image:06d}")
+            for nom in self._captures_demandees:
+                self._capturer(nom)
+            self._captures_demandees.clear()
+        self.images_manquantes = sorted(n for n in self.images_a_capturer if not 0 < n <= self.numero_image)
+        return self.numero_image
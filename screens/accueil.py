@@ -6,13 +6,18 @@ Affiche le menu principal avec le choix des recettes
 """
 
 import pygame
-from ui_components import BoutonImage, dessiner_texte_centre
+from ui_components import BoutonImage, Conteneur, CoucheStatique, dessiner_texte_centre
+from recipes import RECETTES, RECETTES_ACCUEIL
 
 class EcranAccueil:
     """Écran d'accueil avec sélection des recettes"""
+
+    rendu_partiel = True  # seuls les boutons survolés changent
+    evenements_acceptes = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN})
     
     def __init__(self, jeu):
         self.jeu = jeu
+        self.couche_fond = CoucheStatique(self._dessiner_fond, jeu.COULEURS['beige'])
         self.initialiser_boutons()
     
     def initialiser_boutons(self):
@@ -21,45 +26,48 @@ class EcranAccueil:
         hauteur_bouton = 180
         espacement = 80
         
-        # Position de départ pour centrer les 3 boutons
-        debut_x = (self.jeu.largeur - (3 * largeur_bouton + 2 * espacement)) // 2
+        # Position de départ pour centrer les boutons
+        debut_x = (self.jeu.largeur - (len(RECETTES_ACCUEIL) * (largeur_bouton + espacement) - espacement)) // 2
         y = 300
         
-        self.boutons_recettes = {
-            'pain': BoutonImage(
-                debut_x, y, largeur_bouton, hauteur_bouton,
-                "Pain", "images/pain.png", self.jeu.police_normale
-            ),
-            'croissant': BoutonImage(
-                debut_x + largeur_bouton + espacement, y, largeur_bouton, hauteur_bouton,
-                "Croissant", "images/croissant.png", self.jeu.police_normale
-            ),
-            'gateau': BoutonImage(
-                debut_x + 2 * (largeur_bouton + espacement), y, largeur_bouton, hauteur_bouton,
-                "Gâteau", "images/gateau.png", self.jeu.police_normale
+        self.boutons_recettes = {}
+        for i, nom in enumerate(RECETTES_ACCUEIL):
+            recette = RECETTES[nom]
+            self.boutons_recettes[nom] = BoutonImage(
+                debut_x + i * (largeur_bouton + espacement), y, largeur_bouton, hauteur_bouton,
+                recette["nom"], f"images/{recette['images']['base']}", self.jeu.police_normale
             )
-        }
+        self.conteneur_recettes = Conteneur(self.boutons_recettes.values())
+        self._recette_par_bouton = {bouton: nom for nom, bouton in self.boutons_recettes.items()}
     
     def reinitialiser(self):
-        """Remet à zéro l'écran d'accueil"""
-        pass  # Rien à réinitialiser pour l'écran d'accueil
+        """Remet à zéro l'écran d'accueil : aucun bouton ne reste survolé"""
+        self.conteneur_recettes.oublier_survol()
     
     def gerer_evenement(self, evenement):
         """Gère les événements sur l'écran d'accueil"""
-        for nom_recette, bouton in self.boutons_recettes.items():
-            if bouton.gerer_evenement(evenement):
-                self.jeu.choisir_recette(nom_recette)
-                break
+        bouton = self.conteneur_recettes.gerer_evenement(evenement)
+        if bouton is not None:
+            self.jeu.choisir_recette(self._recette_par_bouton[bouton])
     
     def mettre_a_jour(self):
-        """Met à jour l'état de l'écran d'accueil"""
-        # Mise à jour des effets de survol
-        pos_souris = pygame.mouse.get_pos()
-        for bouton in self.boutons_recettes.values():
-            bouton.survole = bouton.rect.collidepoint(pos_souris)
+        """Rien à mettre à jour : le survol suit les MOUSEMOTION routés aux boutons"""
+        pass
     
+    def delai_avant_changement(self):
+        """Rien ne change sans action de l'utilisateur"""
+        return None
+
     def dessiner(self, surface):
         """Dessine l'écran d'accueil"""
+        # Titres et instructions (couche fixe en cache)
+        self.couche_fond.dessiner(surface)
+
+        # Boutons des recettes
+        self.conteneur_recettes.dessiner(surface)
+
+    def _dessiner_fond(self, surface):
+        """Partie fixe de l'écran d'accueil"""
         # Titre principal
         dessiner_texte_centre(
             surface, "Boulange", 80, 
@@ -78,10 +86,6 @@ class EcranAccueil:
             self.jeu.police_normale, self.jeu.COULEURS['noir']
         )
         
-        # Boutons des recettes
-        for bouton in self.boutons_recettes.values():
-            bouton.dessiner(surface)
-        
         # Instructions en bas
         dessiner_texte_centre(
             surface, "Cliquez sur une image pour commencer votre aventure culinaire !", 550,
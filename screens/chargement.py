@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Écran de chargement du jeu Boulange
+Affiche la progression du préchargement des images, puis ouvre l'accueil
+"""
+
+import pygame
+from assets import gestionnaire_assets
+from ui_components import dessiner_texte_centre, signaler_zone
+
+
+class EcranChargement:
+    """Écran affiché pendant le décodage des images en arrière-plan"""
+
+    rendu_partiel = True  # seule la barre de progression change
+    evenements_acceptes = frozenset()
+
+    def __init__(self, jeu, futurs):
+        self.jeu = jeu
+        self.futurs = futurs  # images indispensables aux premiers écrans
+        self._progression_affichee = None
+
+    def reinitialiser(self):
+        """Rien à réinitialiser"""
+        pass
+
+    def gerer_evenement(self, evenement):
+        """Aucune interaction pendant le chargement"""
+        pass
+
+    def progression(self):
+        """Fraction des images prioritaires déjà décodées"""
+        if not self.futurs:
+            return 1.0
+        return sum(1 for futur in self.futurs if futur.done()) / len(self.futurs)
+
+    def mettre_a_jour(self):
+        """Range les images décodées et passe à l'accueil quand tout est prêt"""
+        gestionnaire_assets.integrer_termines()
+        progression = self.progression()
+        if progression >= 1.0:
+            self.jeu.changer_ecran('accueil')
+        elif progression != self._progression_affichee:
+            self._progression_affichee = progression
+            signaler_zone(self._rect_barre())
+
+    def _rect_barre(self):
+        largeur_barre = 300
+        return pygame.Rect((self.jeu.largeur - largeur_barre) // 2, 400, largeur_barre, 20)
+
+    def delai_avant_changement(self):
+        """La fin d'un décodage n'est pas un événement pygame : on vérifie régulièrement"""
+        return 0.02
+
+    def dessiner(self, surface):
+        """Dessine le titre et la barre de progression"""
+        dessiner_texte_centre(
+            surface, "Boulange", 250,
+            self.jeu.police_titre, self.jeu.COULEURS['marron']
+        )
+        dessiner_texte_centre(
+            surface, "Chargement des images...", 330,
+            self.jeu.police_normale, self.jeu.COULEURS['noir']
+        )
+
+        # Barre de progression (même style que le pétrissage)
+        progression = self.progression()
+        fond_rect = self._rect_barre()
+        pygame.draw.rect(surface, self.jeu.COULEURS['gris_clair'], fond_rect)
+        pygame.draw.rect(surface, self.jeu.COULEURS['noir'], fond_rect, 2)
+
+        if progression > 0:
+            prog_rect = pygame.Rect(fond_rect.x, fond_rect.y, int(fond_rect.width * progression), fond_rect.height)
+            pygame.draw.rect(surface, self.jeu.COULEURS['vert'], prog_rect)
@@ -7,21 +7,31 @@ et redirige vers l’écran de résultat (succès ou échec).
 """
 
 import pygame
-import time
-from ui_components import Compteur, Bouton, dessiner_texte_centre, dessiner_fenetre_modale
-from recipes import valider_cuisson, obtenir_parametres_cuisson
+from ui_components import (
+    Compteur, Bouton, Conteneur, CoucheStatique, dessiner_texte_centre, dessiner_fenetre_modale, rendre_texte,
+    zones_modifiees
+)
+from recipes import (
+    INACCESSIBLE, PAS_TEMPERATURE, PAS_TEMPS, TEMPERATURE_MAX, TEMPERATURE_MIN, TEMPS_MAX, TEMPS_MIN,
+    distance_reussite, obtenir_parametres_cuisson
+)
 
 
 class EcranCuisson:
     """Écran de réglage des paramètres de cuisson"""
 
+    rendu_partiel = True
+    evenements_acceptes = frozenset(
+        {pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN}
+    )
+
     def __init__(self, jeu):
         self.jeu = jeu
-        self.tentatives = 0           # compteur d'échecs successifs
-        self.max_tentatives = 5
         self.afficher_aide = False
         self.temps_debut_aide = 0
         self.duree_aide = 10  # secondes
+        self._tache_aide = None  # fermeture planifiée de l'aide
+        self.couche_fond = CoucheStatique(self._dessiner_fond, jeu.COULEURS["beige"])
         self.initialiser_controles()
 
     # ---------------------------------------------------------
@@ -42,9 +52,9 @@ class EcranCuisson:
             self.x_params + 20,  # compteur un peu à droite du texte
             self.y_temp_compteur,
             self.jeu.temperature_choisie,
-            100,
-            300,
-            10,
+            TEMPERATURE_MIN,
+            TEMPERATURE_MAX,
+            PAS_TEMPERATURE,
             "°C",
             self.jeu.police_normale,
         )
@@ -54,9 +64,9 @@ class EcranCuisson:
             self.x_params + 20,
             self.y_duree_compteur,
             self.jeu.temps_choisi,
-            1,
-            60,
-            1,
+            TEMPS_MIN,
+            TEMPS_MAX,
+            PAS_TEMPS,
             "min",
             self.jeu.police_normale,
         )
@@ -73,6 +83,8 @@ class EcranCuisson:
             self.jeu.police_normale,
         )
 
+        self.controles = Conteneur([self.compteur_temperature, self.compteur_temps, self.bouton_lancer])
+
     # ---------------------------------------------------------
     # RÉINITIALISATION DE L'ÉCRAN
     # ---------------------------------------------------------
@@ -80,9 +92,8 @@ class EcranCuisson:
         """
         Réinitialise l'écran de cuisson avec les paramètres actuels.
 
-        ⚠️ On NE remet PAS self.tentatives à 0 ici,
-        pour conserver le comptage des 5 essais même si on revient
-        depuis l'écran de résultat.
+        ⚠️ Le comptage des 5 essais vit dans la partie (core.Partie) :
+        il est conservé quand on revient depuis l'écran de résultat.
         """
         self.afficher_aide = False
         self.temps_debut_aide = 0
@@ -105,14 +116,14 @@ class EcranCuisson:
         if self.afficher_aide:
             # En mode aide, Échap permet de fermer avant la fin
             if evenement.type == pygame.KEYDOWN and evenement.key == pygame.K_ESCAPE:
-                self.afficher_aide = False
+                self._fermer_aide()
             return
 
         if self.compteur_temperature.gerer_evenement(evenement):
-            self.jeu.temperature_choisie = self.compteur_temperature.valeur
+            self.jeu.partie.regler_cuisson(temperature=self.compteur_temperature.valeur)
 
         elif self.compteur_temps.gerer_evenement(evenement):
-            self.jeu.temps_choisi = self.compteur_temps.valeur
+            self.jeu.partie.regler_cuisson(temps=self.compteur_temps.valeur)
 
         if self.bouton_lancer.gerer_evenement(evenement):
             self.lancer_cuisson()
@@ -121,50 +132,61 @@ class EcranCuisson:
     # MISE À JOUR
     # ---------------------------------------------------------
     def mettre_a_jour(self):
-        """Met à jour l'état de l'écran (fermeture automatique de l'aide)."""
-        if self.afficher_aide and (time.time() - self.temps_debut_aide >= self.duree_aide):
-            self.afficher_aide = False
+        """Ouvre l'aide demandée après plusieurs échecs (sa fermeture est planifiée)."""
+        if not self.afficher_aide and self.jeu.partie.prendre_aide_cuisson():
+            self._ouvrir_aide()
+
+    def delai_avant_changement(self):
+        """0 si l'aide doit s'ouvrir, None sinon (fermeture gérée par le planificateur)"""
+        if self.jeu.partie.aide_cuisson:
+            return 0
+        return None
+
+    def _ouvrir_aide(self):
+        planificateur = self.jeu.planificateur
+        self.afficher_aide = True
+        self.temps_debut_aide = planificateur.maintenant()
+        planificateur.annuler(self._tache_aide)
+        self._tache_aide = planificateur.planifier(self.duree_aide, self._fermer_aide, groupe=self)
+        zones_modifiees.tout()
+
+    def _fermer_aide(self):
+        self.jeu.planificateur.annuler(self._tache_aide)
+        self._tache_aide = None
+        self.afficher_aide = False
+        zones_modifiees.tout()
 
     # ---------------------------------------------------------
     # LANCER CUISSON
     # ---------------------------------------------------------
     def lancer_cuisson(self):
         """Valide la cuisson et redirige vers l'écran résultat."""
-        recette_nom = self.jeu.recette_choisie
-        recette = self.jeu.obtenir_recette_actuelle()
-        if not recette_nom or not recette:
+        # La partie construit le résultat et compte les échecs (aide au 5e)
+        res = self.jeu.partie.lancer_cuisson()
+        if res is None:
             return
 
-        # On laisse recipes.valider_cuisson construire tout le résultat
-        res = valider_cuisson(
-            recette_nom,
-            self.jeu.temperature_choisie,
-            self.jeu.temps_choisi,
-        )
-
-        # Gestion des tentatives / aide
         if res.get("succes"):
-            # Succès → on remet les tentatives à zéro
-            self.jeu.transition_vers_pedagogique = time.time() + 10
-            self.tentatives = 0
-        else:
-            # Échec → on incrémente
-            self.tentatives += 1
-            if self.tentatives >= self.max_tentatives:
-                # Au bout de 5 échecs consécutifs, on déclenche l'aide
-                self.jeu.aide_cuisson_pending = True
-                self.tentatives = 0  # on repart sur un nouveau cycle après l'aide
-
-        # On enregistre directement la structure retournée
-        self.jeu.resultat_cuisson = res
-        self.jeu.changer_ecran("resultat")
+            # Page pédagogique après 10 secondes sur le résultat
+            self.jeu.planifier_bilan(10)
+        self.jeu.suivre_partie()
 
     # ---------------------------------------------------------
     # DESSIN
     # ---------------------------------------------------------
     def dessiner(self, surface):
-        surface.fill(self.jeu.COULEURS["beige"])
+        # Fond, titres, four et libellés (couche fixe, refaite si la recette change)
+        self.couche_fond.dessiner(surface, cle=self.jeu.recette_choisie)
+
+        # Compteurs et bouton LANCER au centre bas
+        self.controles.dessiner(surface)
 
+        # Aide après plusieurs échecs
+        if self.afficher_aide:
+            self.dessiner_aide(surface)
+
+    def _dessiner_fond(self, surface):
+        """Partie fixe de l'écran de cuisson"""
         # Titre
         dessiner_texte_centre(
             surface,
@@ -190,33 +212,17 @@ class EcranCuisson:
 
         # --- PARAMÈTRES À DROITE ---
         # Texte température
-        temp_txt = self.jeu.police_normale.render(
-            "Température du four :", True, self.jeu.COULEURS["noir"]
+        temp_txt = rendre_texte(
+            self.jeu.police_normale, "Température du four :", True, self.jeu.COULEURS["noir"]
         )
         surface.blit(temp_txt, (self.x_params, self.y_temp_texte))
 
         # Texte durée
-        duree_txt = self.jeu.police_normale.render(
-            "Durée de cuisson :", True, self.jeu.COULEURS["noir"]
+        duree_txt = rendre_texte(
+            self.jeu.police_normale, "Durée de cuisson :", True, self.jeu.COULEURS["noir"]
         )
         surface.blit(duree_txt, (self.x_params, self.y_duree_texte))
 
-        # Compteurs
-        self.compteur_temperature.dessiner(surface)
-        self.compteur_temps.dessiner(surface)
-
-        # Bouton LANCER au centre bas
-        self.bouton_lancer.dessiner(surface)
-
-        # Aide si demandée après plusieurs échecs
-        if getattr(self.jeu, "aide_cuisson_pending", False) and not self.afficher_aide:
-            self.afficher_aide = True
-            self.jeu.aide_cuisson_pending = False
-            self.temps_debut_aide = time.time()
-
-        if self.afficher_aide:
-            self.dessiner_aide(surface)
-
     # ---------------------------------------------------------
     # AIDE
     # ---------------------------------------------------------
@@ -235,6 +241,15 @@ class EcranCuisson:
             "Appuie sur Échap pour fermer cette aide."
         ]
 
+        # Distance lue dans la table de la recette (réglages actuels des compteurs)
+        crans = distance_reussite(
+            self.jeu.recette_choisie, self.compteur_temperature.valeur, self.compteur_temps.valeur
+        )
+        if crans == 0:
+            contenu.insert(3, "Tes réglages actuels sont les bons !")
+        elif crans is not None and crans != INACCESSIBLE:
+            contenu.insert(3, f"Tes réglages sont à {crans} clic{'s' if crans > 1 else ''} de la réussite.")
+
         dessiner_fenetre_modale(
             surface,
             600,
@@ -269,5 +284,5 @@ class EcranCuisson:
         pygame.draw.rect(surface, (200, 220, 255), vitre_rect)
         pygame.draw.rect(surface, self.jeu.COULEURS["noir"], vitre_rect, 2)
 
-        texte_four = self.jeu.police_petite.render("FOUR", True, self.jeu.COULEURS["blanc"])
+        texte_four = rendre_texte(self.jeu.police_petite, "FOUR", True, self.jeu.COULEURS["blanc"])
         surface.blit(texte_four, (four_x + 10, four_y + 10))
@@ -12,10 +12,9 @@ Affiche en une seule colonne :
 Affichage vertical avec scroll + barre de défilement.
 """
 
-import time
 import pygame
-from ui_components import Bouton, dessiner_texte_centre
-from recipes import RECETTES
+from ui_components import Bouton, CoucheStatique, dessiner_texte_centre, signaler_zone
+from recipes import BITS_INGREDIENTS, RECETTES
 
 # Petit dictionnaire pédagogique : rôle des ingrédients
 ROLES_INGREDIENTS = {
@@ -35,11 +34,28 @@ ROLES_INGREDIENTS = {
 class EcranPedagogique:
     """Écran qui explique pédagogiquement la recette réalisée."""
 
+    rendu_partiel = True  # seul le défilement et le survol des boutons changent l'image
+    evenements_acceptes = frozenset({
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYDOWN
+    })
+
     def __init__(self, jeu):
         self.jeu = jeu
         self.contenu_lignes = []     # toutes les lignes de texte, dans l’ordre
         self.scroll_offset = 0       # défilement vertical
-        self._content_height = 0     # hauteur totale estimée du contenu (pour la scrollbar)
+        self._content_height = 0     # hauteur totale du contenu mis en page (pour la scrollbar)
+        self._page = None            # surface pré-rendue de tout le contenu
+
+        # Colonne de texte à l’intérieur de la carte
+        self.x_contenu = 80
+        self.largeur_contenu = jeu.largeur - 2 * self.x_contenu
+
+        # Zone de contenu (viewport) : entre le titre et les boutons
+        self.viewport_top = 120
+        self.viewport_height = jeu.hauteur - 120 - self.viewport_top
+
+        # Titre et carte blanche (couche fixe en cache)
+        self.couche_fond = CoucheStatique(self._dessiner_fond, jeu.COULEURS["beige"])
 
         # Boutons en bas (fixes)
         self.bouton_refaire = Bouton(
@@ -65,9 +81,15 @@ class EcranPedagogique:
         self.scroll_offset = 0
         self._construire_contenu()
 
-        # Estimation simple de la hauteur de contenu (pour la barre de scroll)
-        ligne_h = self.jeu.police_petite.get_height() + 4
-        self._content_height = max(len(self.contenu_lignes) * ligne_h, 0)
+        # Mise en page et rendu une seule fois : le défilement ne fait plus qu’un blit
+        self._page = self._rendre_page(
+            self.contenu_lignes,
+            largeur_max=self.largeur_contenu,
+            police=self.jeu.police_petite,
+            couleur=self.jeu.COULEURS["noir"],
+            fond=self.jeu.COULEURS["blanc"],
+        )
+        self._content_height = self._page.get_height()
 
     def _construire_contenu(self):
         self.contenu_lignes = []
@@ -84,9 +106,7 @@ class EcranPedagogique:
         temps_ideal = recette.get("temps_ideal")
 
         # Temps total utilisé
-        temps_total = self.jeu.temps_final
-        if temps_total is None and self.jeu.start_time:
-            temps_total = int(time.monotonic() - self.jeu.start_time)
+        temps_total = self.jeu.partie.temps_ecoule(self.jeu.planificateur.maintenant())
 
         if temps_total is not None:
             minutes = temps_total // 60
@@ -151,7 +171,7 @@ class EcranPedagogique:
         self.contenu_lignes.append("")
 
         requis = recette.get("ingredients_requis", [])
-        selectionnes = self.jeu.ingredients_selectionnes or []
+        selection = self.jeu.partie.selection  # masque de bits (recipes.BITS_INGREDIENTS)
 
         if not requis:
             self.contenu_lignes.append(
@@ -165,7 +185,7 @@ class EcranPedagogique:
                 )
                 nom_affiche_ing = ing.capitalize()
 
-                if ing in selectionnes:
+                if selection & BITS_INGREDIENTS.get(ing, 0):
                     info_sel = "(bien sélectionné)"
                 else:
                     info_sel = "(non sélectionné)"
@@ -207,6 +227,8 @@ class EcranPedagogique:
         if self.bouton_menu.gerer_evenement(evenement):
             self.jeu.reinitialiser_jeu()
 
+        ancien_offset = self.scroll_offset
+
         # Scroll à la molette (pygame 2)
         if evenement.type == pygame.MOUSEWHEEL:
             # event.y > 0 : vers le haut, < 0 : vers le bas
@@ -219,15 +241,52 @@ class EcranPedagogique:
             elif evenement.key == pygame.K_DOWN:
                 self.scroll_offset -= 20
 
+        if self.scroll_offset != ancien_offset:
+            # Carte de contenu + barre de défilement
+            signaler_zone(pygame.Rect(0, 110, self.jeu.largeur, self.jeu.hauteur - 220))
+
     def mettre_a_jour(self):
         pass
 
+    def delai_avant_changement(self):
+        """Seul le défilement (événement) change l'image"""
+        return None
+
     # ---------------------------------------------------------
     # DESSIN
     # ---------------------------------------------------------
     def dessiner(self, surface):
-        surface.fill(self.jeu.COULEURS["beige"])
+        # Titre et carte blanche (couche fixe en cache)
+        self.couche_fond.dessiner(surface)
+
+        viewport_top = self.viewport_top
+        viewport_height = self.viewport_height
 
+        # Clamp du scroll pour ne pas sortir du contenu
+        if self._content_height <= viewport_height:
+            self.scroll_offset = 0
+        else:
+            max_offset = 0
+            min_offset = viewport_height - self._content_height  # valeur négative
+            if self.scroll_offset > max_offset:
+                self.scroll_offset = max_offset
+            if self.scroll_offset < min_offset:
+                self.scroll_offset = min_offset
+
+        # Texte pré-rendu : on n’affiche que la partie visible dans la carte
+        if self._page is not None:
+            zone_visible = pygame.Rect(0, -self.scroll_offset, self.largeur_contenu, viewport_height)
+            surface.blit(self._page, (self.x_contenu, viewport_top), zone_visible)
+
+        # Affichage de la barre de scroll à droite
+        self._dessiner_scrollbar(surface, viewport_top, viewport_height)
+
+        # Boutons fixes en bas
+        self.bouton_refaire.dessiner(surface)
+        self.bouton_menu.dessiner(surface)
+
+    def _dessiner_fond(self, surface):
+        """Partie fixe : titre et carte blanche du contenu"""
         # Titre principal
         dessiner_texte_centre(
             surface,
@@ -246,88 +305,59 @@ class EcranPedagogique:
            #  self.jeu.COULEURS["noir"],
        #  )
 
-        # Zone de contenu (viewport) : entre le titre et les boutons
-        viewport_top = 120
-        viewport_bottom = self.jeu.hauteur - 120
-        viewport_height = viewport_bottom - viewport_top
-
-        # Clamp du scroll pour ne pas sortir du contenu
-        if self._content_height <= viewport_height:
-            self.scroll_offset = 0
-        else:
-            max_offset = 0
-            min_offset = viewport_height - self._content_height  # valeur négative
-            if self.scroll_offset > max_offset:
-                self.scroll_offset = max_offset
-            if self.scroll_offset < min_offset:
-                self.scroll_offset = min_offset
-
         # Carte blanche pour le contenu
         content_rect = pygame.Rect(
             60,
-            viewport_top - 10,
+            self.viewport_top - 10,
             self.jeu.largeur - 120,
-            viewport_height + 20,
+            self.viewport_height + 20,
         )
         pygame.draw.rect(surface, self.jeu.COULEURS["blanc"], content_rect, border_radius=12)
         pygame.draw.rect(surface, self.jeu.COULEURS["gris_clair"], content_rect, 2, border_radius=12)
 
-        # Dessin du texte à l’intérieur de la carte, en une colonne
-        x_contenu = 80
-        y_depart = viewport_top + self.scroll_offset
-        largeur_max = self.jeu.largeur - 2 * x_contenu
-
-        self._dessiner_contenu_colonne(
-            surface,
-            x=x_contenu,
-            y_depart=y_depart,
-            largeur_max=largeur_max,
-            lignes=self.contenu_lignes,
-            police=self.jeu.police_petite,
-            couleur=self.jeu.COULEURS["noir"],
-        )
-
-        # Affichage de la barre de scroll à droite
-        self._dessiner_scrollbar(surface, viewport_top, viewport_height)
-
-        # Boutons fixes en bas
-        self.bouton_refaire.dessiner(surface)
-        self.bouton_menu.dessiner(surface)
-
     # ---------------------------------------------------------
-    # OUTIL : DESSIN MULTI-LIGNES AVEC RETOUR À LA LIGNE
+    # OUTIL : MISE EN PAGE MULTI-LIGNES AVEC RETOUR À LA LIGNE
     # ---------------------------------------------------------
-    def _dessiner_contenu_colonne(
-        self, surface, x, y_depart, largeur_max, lignes, police, couleur, interligne=4
-    ):
+    @staticmethod
+    def _mettre_en_page(lignes, largeur_max, police, interligne=4):
         """
-        Dessine une liste de lignes, avec retour à la ligne automatique
-        si une ligne est trop longue (wrap par mots).
+        Coupe les lignes trop longues (wrap par mots, mesuré avec police.size)
+        et retourne ([(texte, y), ...], hauteur totale).
         """
-        y = y_depart
+        pas = police.get_height() + interligne
+        placees = []
+        y = 0
         for ligne in lignes:
             if not ligne:
                 # ligne vide -> saut de ligne
-                y += police.get_height() + interligne
+                y += pas
                 continue
 
-            mots = ligne.split(" ")
             courant = ""
-            for mot in mots:
+            for mot in ligne.split(" "):
                 test = (courant + " " + mot).strip()
-                rendu_test = police.render(test, True, couleur)
-                if rendu_test.get_width() > largeur_max and courant:
-                    rendu_courant = police.render(courant, True, couleur)
-                    surface.blit(rendu_courant, (x, y))
-                    y += police.get_height() + interligne
+                if police.size(test)[0] > largeur_max and courant:
+                    placees.append((courant, y))
+                    y += pas
                     courant = mot
                 else:
                     courant = test
 
             if courant:
-                rendu_courant = police.render(courant, True, couleur)
-                surface.blit(rendu_courant, (x, y))
-                y += police.get_height() + interligne
+                placees.append((courant, y))
+                y += pas
+        return placees, y
+
+    def _rendre_page(self, lignes, largeur_max, police, couleur, fond):
+        """Rend tout le contenu mis en page dans une seule surface haute"""
+        placees, hauteur = self._mettre_en_page(lignes, largeur_max, police)
+        page = pygame.Surface((largeur_max, max(1, hauteur)))
+        if pygame.display.get_surface() is not None:
+            page = page.convert()
+        page.fill(fond)
+        for texte, y in placees:
+            page.blit(police.render(texte, True, couleur), (0, y))
+        return page
 
     # ---------------------------------------------------------
     # BARRE DE SCROLL
@@ -7,24 +7,39 @@ Affiche une animation de pétrissage avec la pâte qui bouge
 
 import pygame
 import math
-import time
-from ui_components import dessiner_texte_centre
+from ui_components import CoucheStatique, dessiner_texte_centre, signaler_zone
 
 class EcranPetrissage:
     """Écran d'animation de pétrissage"""
+
+    rendu_partiel = True  # le titre reste fixe, le reste est animé
+    evenements_acceptes = frozenset()  # aucune interaction pendant le pétrissage
     
     def __init__(self, jeu):
         self.jeu = jeu
-        self.temps_debut = 0
+        self.temps_debut = None
         self.duree_petrissage = 4.0  # 4 secondes
         self.phase = "petrissage"  # "petrissage" ou "termine"
         self.temps_animation = 0
+        self.couche_fond = CoucheStatique(self._dessiner_fond, jeu.COULEURS['beige'])
     
     def reinitialiser(self):
-        """Remet à zéro l'animation de pétrissage"""
-        self.temps_debut = time.time()
+        """Remet à zéro l'animation de pétrissage et planifie ses deux étapes"""
+        planificateur = self.jeu.planificateur
+        self.temps_debut = planificateur.maintenant()
         self.phase = "petrissage"
         self.temps_animation = 0
+        planificateur.annuler_groupe(self)
+        planificateur.planifier(self.duree_petrissage, self._terminer, groupe=self)
+        # 1.5s pour "terminé", puis passage automatique à la cuisson
+        planificateur.planifier(self.duree_petrissage + 1.5, self._passer_a_la_cuisson, groupe=self)
+
+    def _terminer(self):
+        self.phase = "termine"
+
+    def _passer_a_la_cuisson(self):
+        self.jeu.partie.terminer_petrissage()
+        self.jeu.suivre_partie()
     
     def gerer_evenement(self, evenement):
         """Gère les événements (aucun pendant le pétrissage)"""
@@ -32,27 +47,20 @@ class EcranPetrissage:
     
     def mettre_a_jour(self):
         """Met à jour l'animation de pétrissage"""
-        if self.temps_debut == 0:
-            self.temps_debut = time.time()
-        
-        temps_ecoule = time.time() - self.temps_debut
-        self.temps_animation = temps_ecoule
+        if self.temps_debut is None:
+            self.reinitialiser()
         
-        if temps_ecoule < self.duree_petrissage:
-            self.phase = "petrissage"
-        elif temps_ecoule < self.duree_petrissage + 1.5:  # 1.5s pour "terminé"
-            self.phase = "termine"
-        else:
-            # Passage automatique à la cuisson
-            self.jeu.changer_ecran('cuisson')
+        self.temps_animation = self.jeu.planificateur.maintenant() - self.temps_debut
+        signaler_zone(pygame.Rect(0, 140, self.jeu.largeur, self.jeu.hauteur - 140))
     
+    def delai_avant_changement(self):
+        """Animation continue : une image à chaque tour de boucle"""
+        return 0
+
     def dessiner(self, surface):
         """Dessine l'écran de pétrissage avec animation"""
-        # Titre
-        if self.jeu.recette_choisie:
-            recette = self.jeu.obtenir_recette_actuelle()
-            titre = f"Préparation de votre {recette['nom'].lower()}"
-            dessiner_texte_centre(surface, titre, 50, self.jeu.police_titre, self.jeu.COULEURS['marron'])
+        # Titre (couche fixe, refaite si la recette change)
+        self.couche_fond.dessiner(surface, cle=self.jeu.recette_choisie)
         
         # Message selon la phase
         if self.phase == "petrissage":
@@ -71,6 +79,13 @@ class EcranPetrissage:
         if self.phase == "petrissage":
             self.dessiner_barre_progression(surface)
     
+    def _dessiner_fond(self, surface):
+        """Partie fixe : titre avec le nom de la recette"""
+        if self.jeu.recette_choisie:
+            recette = self.jeu.obtenir_recette_actuelle()
+            titre = f"Préparation de votre {recette['nom'].lower()}"
+            dessiner_texte_centre(surface, titre, 50, self.jeu.police_titre, self.jeu.COULEURS['marron'])
+    
     def dessiner_animation_pate(self, surface):
         """Dessine la pâte animée au centre de l'écran"""
         centre_x = self.jeu.largeur // 2
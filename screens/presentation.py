@@ -12,6 +12,8 @@ from ui_components import Bouton, dessiner_texte_centre
 class EcranPresentation:
     """Page d’accueil avant le menu principal"""
 
+    evenements_acceptes = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+
     def __init__(self, jeu):
         self.jeu = jeu
         self.image_universite = None
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registre des écrans du jeu Boulange
+Importe et construit chaque écran la première fois qu'on y accède,
+et mesure le coût de construction de chacun.
+"""
+
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from traces import tampon_traces
+
+# Écrans connus : nom -> "module:Classe" (ou toute fabrique appelée avec le jeu)
+ECRANS = {
+    'presentation': 'screens.presentation:EcranPresentation',
+    'accueil': 'screens.accueil:EcranAccueil',
+    'selection_ingredients': 'screens.selection_ingredients:EcranSelectionIngredients',
+    'petrissage': 'screens.petrissage:EcranPetrissage',
+    'cuisson': 'screens.cuisson:EcranCuisson',
+    'resultat': 'screens.resultat:EcranResultat',
+    'pedagogique': 'screens.pedagogique:EcranPedagogique',
+}
+
+# Écran le plus probable après chaque écran (pour le préchauffage)
+ECRANS_SUIVANTS = {
+    'presentation': 'accueil',
+    'accueil': 'selection_ingredients',
+    'selection_ingredients': 'petrissage',
+    'petrissage': 'cuisson',
+    'cuisson': 'resultat',
+    'resultat': 'pedagogique',
+}
+
+
+def enregistrer_ecran(nom, cible, suivant=None):
+    """Déclare un nouvel écran pour tous les jeux créés ensuite (sans modifier Game)"""
+    ECRANS[nom] = cible
+    if suivant:
+        ECRANS_SUIVANTS[nom] = suivant
+
+
+def _resoudre(cible):
+    """Transforme "module:Classe" en classe (importe le module si besoin)"""
+    if not isinstance(cible, str):
+        return cible
+    nom_module, _, nom_classe = cible.partition(":")
+    return getattr(importlib.import_module(nom_module), nom_classe)
+
+
+class RegistreEcrans:
+    """Dictionnaire d'écrans construits à la demande"""
+
+    def __init__(self, jeu, declarations=None, suivants=None):
+        self.jeu = jeu
+        self.declarations = dict(ECRANS if declarations is None else declarations)
+        self.suivants = dict(ECRANS_SUIVANTS if suivants is None else suivants)
+        self.couts = {}           # nom -> secondes (import + construction)
+        self._ecrans = {}         # écrans déjà construits
+        self._imports = {}        # nom -> Future de l'import en arrière-plan
+        self._executeur = None
+
+    def enregistrer(self, nom, cible, suivant=None):
+        """Déclare (ou remplace) un écran construit à la demande"""
+        self.declarations[nom] = cible
+        self._ecrans.pop(nom, None)
+        if suivant:
+            self.suivants[nom] = suivant
+
+    def ajouter(self, nom, ecran):
+        """Ajoute un écran déjà construit"""
+        self._ecrans[nom] = ecran
+
+    def __contains__(self, nom):
+        return nom in self._ecrans or nom in self.declarations
+
+    def __getitem__(self, nom):
+        ecran = self._ecrans.get(nom)
+        if ecran is None:
+            ecran = self._construire(nom)
+        return ecran
+
+    def est_construit(self, nom):
+        return nom in self._ecrans
+
+    def _construire(self, nom):
+        if nom not in self.declarations:
+            raise KeyError(nom)
+        debut = time.perf_counter()
+        futur = self._imports.pop(nom, None)
+        classe = futur.result() if futur is not None else _resoudre(self.declarations[nom])
+        ecran = classe(self.jeu)
+        fin = time.perf_counter()
+        self.couts[nom] = fin - debut
+        tampon_traces.ajouter(f"construire {nom}", "ecrans", debut, fin)
+        self._ecrans[nom] = ecran
+        return ecran
+
+    # --------------------------
+    # PRÉCHAUFFAGE
+    # --------------------------
+
+    def prechauffer(self, nom):
+        """
+        Importe le module d'un écran en arrière-plan.
+        La construction reste dans le fil principal (pygame n'est pas sûr entre fils).
+        """
+        if nom in self._ecrans or nom in self._imports or nom not in self.declarations:
+            return
+        if self._executeur is None:
+            self._executeur = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ecrans")
+        self._imports[nom] = self._executeur.submit(_resoudre, self.declarations[nom])
+
+    def prechauffer_suivant(self, nom):
+        """Préchauffe l'écran qui suit le plus probablement `nom`"""
+        suivant = self.suivants.get(nom)
+        if suivant:
+            self.prechauffer(suivant)
@@ -5,22 +5,27 @@
 Affiche le résultat de la cuisson avec messages personnalisés.
 """
 
-import os
 import pygame
-from ui_components import Bouton, dessiner_texte_centre
+from assets import charger_image
+from ui_components import Bouton, CoucheStatique, dessiner_texte_centre
 
 
 class EcranResultat:
     """Écran de résultat final avec messages adaptés."""
 
+    rendu_partiel = True  # écran statique, seul le bouton survolé change
+    evenements_acceptes = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+
     def __init__(self, jeu):
         self.jeu = jeu
         self.resultat_cuisson = None
         self.bouton_action = None
+        self.couche_fond = CoucheStatique(self._dessiner_fond, jeu.COULEURS["beige"])
 
     def reinitialiser(self):
         """Prépare le résultat et le bouton d’action."""
         self.resultat_cuisson = self.jeu.resultat_cuisson
+        self.couche_fond.invalider()  # nouveau résultat : titre, image et messages à refaire
         self.creer_bouton()
 
     def creer_bouton(self):
@@ -43,16 +48,30 @@ class EcranResultat:
     def gerer_evenement(self, evenement):
         """Bouton Réessayer."""
         if self.bouton_action and self.bouton_action.gerer_evenement(evenement):
-            self.jeu.changer_ecran("cuisson")
+            self.jeu.partie.reessayer_cuisson()
+            self.jeu.suivre_partie()
 
     def mettre_a_jour(self):
         pass
 
+    def delai_avant_changement(self):
+        """Écran statique (la transition vers la page pédagogique est gérée par le jeu)"""
+        return None
+
     def dessiner(self, surface):
         """Affiche le résultat final."""
         if not self.resultat_cuisson or not self.jeu.recette_choisie:
             return
 
+        # --- TITRE, IMAGE ET MESSAGES (couche fixe en cache) ---
+        self.couche_fond.dessiner(surface)
+
+        # --- BOUTON SI ECHEC ---
+        if self.bouton_action:
+            self.bouton_action.dessiner(surface)
+
+    def _dessiner_fond(self, surface):
+        """Partie fixe : elle ne change qu'avec le résultat"""
         recette = self.jeu.obtenir_recette_actuelle()
 
         # --- TITRE ---
@@ -70,10 +89,6 @@ class EcranResultat:
         # --- MESSAGE PERSONNALISÉ ---
         self.dessiner_messages(surface)
 
-        # --- BOUTON SI ECHEC ---
-        if self.bouton_action:
-            self.bouton_action.dessiner(surface)
-
     # --------------------------------------------------------------
     # AFFICHAGE DU PRODUIT
     # --------------------------------------------------------------
@@ -87,15 +102,12 @@ class EcranResultat:
         pygame.draw.rect(surface, (240, 240, 240), rect_img)
         pygame.draw.rect(surface, self.jeu.COULEURS["noir"], rect_img, 3)
 
-        # Produit
+        # Produit (décodé une seule fois, puis servi depuis le cache)
         chemin = self.resultat_cuisson.get("image_path")
         if chemin:
-            try:
-                img = pygame.image.load(chemin).convert_alpha()
-                img = pygame.transform.scale(img, (largeur, hauteur))
+            img = charger_image(chemin, (largeur, hauteur))
+            if img is not None:
                 surface.blit(img, (x, y))
-            except:
-                pass
 
     # --------------------------------------------------------------
     # AFFICHAGE DES MESSAGES SELON LE RÉSULTAT
@@ -6,15 +6,23 @@ Permet de choisir les ingrédients nécessaires à la recette
 """
 
 import pygame
-import time
 import random
-from ui_components import BoutonImage, Bouton, dessiner_texte_centre, dessiner_fenetre_modale
-from recipes import TOUS_INGREDIENTS, valider_ingredients, obtenir_aide_ingredients
+from ui_components import (
+    BoutonImage, Bouton, Conteneur, CoucheStatique, dessiner_texte_centre, dessiner_fenetre_modale,
+    signaler_zone, zones_modifiees
+)
+from core import ERREURS_AVANT_AIDE
+from recipes import TOUS_INGREDIENTS, obtenir_aide_ingredients
 
 
 class EcranSelectionIngredients:
     """Écran de sélection des ingrédients"""
 
+    rendu_partiel = True
+    evenements_acceptes = frozenset(
+        {pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN}
+    )
+
     def __init__(self, jeu):
         self.jeu = jeu
         self.boutons_ingredients = {}
@@ -24,6 +32,9 @@ class EcranSelectionIngredients:
         self.message_erreur = ""
         self.temps_message = 0
         self.positions_ingredients = []  # mémorise les positions initiales
+        self._taches_aide = []           # décompte et fermeture planifiés de la fenêtre d'aide
+        self._tache_message = None       # effacement planifié du message d'erreur
+        self.couche_fond = CoucheStatique(self._dessiner_fond, jeu.COULEURS["beige"])
         self.initialiser_boutons()
 
     def initialiser_boutons(self):
@@ -64,6 +75,9 @@ class EcranSelectionIngredients:
                 self.boutons_ingredients[ingredient] = bouton
                 self.positions_ingredients.append((x, y))
 
+        self.grille_ingredients = Conteneur(self.boutons_ingredients.values())
+        self._ingredient_par_bouton = {bouton: nom for nom, bouton in self.boutons_ingredients.items()}
+
         # --- Boutons d'action ---
 
         # Bouton "Valider"
@@ -116,14 +130,13 @@ class EcranSelectionIngredients:
         if self.afficher_aide:
             # En mode aide, seule l'échap ou le temps peut fermer
             if evenement.type == pygame.KEYDOWN and evenement.key == pygame.K_ESCAPE:
-                self.afficher_aide = False
+                self._fermer_aide()
             return
 
         # Gestion des ingrédients
-        for nom_ingredient, bouton in self.boutons_ingredients.items():
-            if bouton.gerer_evenement(evenement):
-                self.basculer_ingredient(nom_ingredient)
-                break
+        bouton = self.grille_ingredients.gerer_evenement(evenement)
+        if bouton is not None:
+            self.basculer_ingredient(self._ingredient_par_bouton[bouton])
 
         # Gestion des boutons d'action
         if self.bouton_valider.gerer_evenement(evenement):
@@ -131,75 +144,109 @@ class EcranSelectionIngredients:
         elif self.bouton_reinitialiser.gerer_evenement(evenement):
             self.reinitialiser_selection()
         elif self.bouton_changer_recette.gerer_evenement(evenement):
-            self.jeu.changer_ecran("accueil")
+            self.jeu.partie.changer_recette()
+            self.jeu.suivre_partie()
 
     def basculer_ingredient(self, nom_ingredient):
         """Active/désactive la sélection d'un ingrédient"""
-        bouton = self.boutons_ingredients[nom_ingredient]
+        selectionne = self.jeu.partie.basculer_ingredient(nom_ingredient)
+        self.boutons_ingredients[nom_ingredient].selectionne = selectionne
+        signaler_zone(self._zone_ligne(80, self.jeu.police_normale))
 
-        if bouton.selectionne:
-            bouton.selectionne = False
-            if nom_ingredient in self.jeu.ingredients_selectionnes:
-                self.jeu.ingredients_selectionnes.remove(nom_ingredient)
-        else:
-            bouton.selectionne = True
-            if nom_ingredient not in self.jeu.ingredients_selectionnes:
-                self.jeu.ingredients_selectionnes.append(nom_ingredient)
+    def _zone_ligne(self, y, police):
+        """Zone d'une ligne de texte centrée (compteur de sélection, message d'erreur)"""
+        return pygame.Rect(0, y, self.jeu.largeur, police.get_height())
 
     def valider_selection(self):
         """Valide la sélection d'ingrédients"""
-        if not self.jeu.recette_choisie:
+        partie = self.jeu.partie
+        if not partie.recette:
             return
 
-        if valider_ingredients(self.jeu.recette_choisie, self.jeu.ingredients_selectionnes):
+        if partie.valider_ingredients():
             # Sélection correcte, passer au pétrissage
-            self.jeu.changer_ecran("petrissage")
+            self.jeu.suivre_partie()
         else:
-            # Sélection incorrecte
-            self.jeu.compteur_erreurs += 1
-            self.message_erreur = f"Ingrédients incorrects ! Tentative {self.jeu.compteur_erreurs}/5"
-            self.temps_message = time.time()
+            # Sélection incorrecte (la partie a compté l'erreur et vidé la sélection)
+            self.message_erreur = (
+                f"Ingrédients incorrects ! Tentative {partie.erreurs_ingredients}/{ERREURS_AVANT_AIDE}"
+            )
+            self.temps_message = self.jeu.planificateur.maintenant()
+            self.jeu.planificateur.annuler(self._tache_message)
+            self._tache_message = self.jeu.planificateur.planifier(3, self._effacer_message, groupe=self)
 
             # 🔁 Mélange aléatoire des positions des ingrédients
             positions_melangees = self.positions_ingredients[:]
             random.shuffle(positions_melangees)
 
             for (ingredient, bouton), pos in zip(self.boutons_ingredients.items(), positions_melangees):
-                bouton.rect.topleft = pos
+                bouton.deplacer(pos)
 
-            # Réinitialise la sélection
-            self.jeu.ingredients_selectionnes = []
+            # Réinitialise la sélection affichée
             for bouton in self.boutons_ingredients.values():
                 bouton.selectionne = False
 
-            # Après 5 erreurs → aide
-            if self.jeu.compteur_erreurs >= 5:
-                self.afficher_aide = True
-                self.temps_debut_aide = time.time()
-                self.jeu.compteur_erreurs = 0  # reset
+            # Les boutons ont bougé et le message est apparu : rendu complet
+            zones_modifiees.tout()
+
+            # Après 5 erreurs → aide (le compte repart de zéro)
+            if partie.prendre_aide_ingredients():
+                self._ouvrir_aide()
 
     def reinitialiser_selection(self):
         """Remet à zéro la sélection des ingrédients"""
-        self.jeu.ingredients_selectionnes = []
+        self.jeu.partie.vider_selection()
         for bouton in self.boutons_ingredients.values():
             bouton.selectionne = False
         self.message_erreur = ""
+        signaler_zone(self._zone_ligne(80, self.jeu.police_normale))
+        signaler_zone(self._zone_ligne(548, self.jeu.police_normale))
+
+    # --------------------------
+    # ÉCHÉANCES (planificateur du jeu)
+    # --------------------------
+
+    def _ouvrir_aide(self):
+        """Affiche l'aide : décompte chaque seconde, fermeture après duree_aide"""
+        planificateur = self.jeu.planificateur
+        self.afficher_aide = True
+        self.temps_debut_aide = planificateur.maintenant()
+        for tache in self._taches_aide:
+            planificateur.annuler(tache)
+        self._taches_aide = [
+            planificateur.planifier(1, self._signaler_aide, periode=1, groupe=self),
+            planificateur.planifier(self.duree_aide, self._fermer_aide, groupe=self),
+        ]
+
+    def _signaler_aide(self):
+        """Le décompte de la fenêtre d'aide change chaque seconde"""
+        signaler_zone(pygame.Rect(
+            (self.jeu.largeur - 500) // 2, (self.jeu.hauteur - 400) // 2, 500, 400
+        ))
+
+    def _fermer_aide(self):
+        for tache in self._taches_aide:
+            self.jeu.planificateur.annuler(tache)
+        self._taches_aide = []
+        self.afficher_aide = False
+        zones_modifiees.tout()
+
+    def _effacer_message(self):
+        """Efface le message d'erreur (3 secondes après son apparition)"""
+        self._tache_message = None
+        self.message_erreur = ""
+        signaler_zone(self._zone_ligne(548, self.jeu.police_normale))
 
     def mettre_a_jour(self):
-        """Met à jour l'état de l'écran"""
-        # Gestion du temps d'affichage de l'aide
-        if self.afficher_aide:
-            temps_ecoule = time.time() - self.temps_debut_aide
-            if temps_ecoule >= self.duree_aide:
-                self.afficher_aide = False
+        """Rien à faire : l'aide et le message sont gérés par le planificateur"""
+        pass
 
-        # Effacement du message d'erreur après 3 secondes
-        if self.message_erreur and time.time() - self.temps_message > 3:
-            self.message_erreur = ""
+    def delai_avant_changement(self):
+        """L'écran ne change que sur événement ou échéance planifiée"""
+        return None
 
-    def dessiner(self, surface):
-        """Dessine l'écran de sélection des ingrédients"""
-        # Titre avec nom de la recette
+    def _dessiner_fond(self, surface):
+        """Partie fixe : titre avec le nom de la recette"""
         if self.jeu.recette_choisie:
             recette = self.jeu.obtenir_recette_actuelle()
             titre = f"Ingrédients pour : {recette['nom']}"
@@ -211,6 +258,11 @@ class EcranSelectionIngredients:
                 self.jeu.COULEURS["marron"],
             )
 
+    def dessiner(self, surface):
+        """Dessine l'écran de sélection des ingrédients"""
+        # Titre avec nom de la recette (couche fixe, refaite si la recette change)
+        self.couche_fond.dessiner(surface, cle=self.jeu.recette_choisie)
+
         # Instructions
         instruction = f"Sélectionnés : {len(self.jeu.ingredients_selectionnes)} ingrédients"
         dessiner_texte_centre(
@@ -222,8 +274,7 @@ class EcranSelectionIngredients:
         )
 
         # Boutons des ingrédients
-        for bouton in self.boutons_ingredients.values():
-            bouton.dessiner(surface)
+        self.grille_ingredients.dessiner(surface)
 
         # ✅ Message d'erreur juste après les boutons d'ingrédients (en bas de la grille)
         if self.message_erreur:
@@ -242,7 +293,8 @@ class EcranSelectionIngredients:
 
         # Fenêtre d'aide
         if self.afficher_aide and self.jeu.recette_choisie:
-            temps_restant = max(0, self.duree_aide - int(time.time() - self.temps_debut_aide))
+            ecoule = self.jeu.planificateur.maintenant() - self.temps_debut_aide
+            temps_restant = max(0, self.duree_aide - int(ecoule))
 
             # Contenu de l'aide
             ingredients_corrects = obtenir_aide_ingredients(self.jeu.recette_choisie)
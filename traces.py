@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Traces d'exécution du jeu Boulange
+Tampon circulaire d'intervalles horodatés (boucle, changements d'écran,
+construction et réinitialisation des écrans, chargement des images), exportable
+au format « Trace Event » de Chrome (chrome://tracing, ui.perfetto.dev).
+Export : touche F4 en jeu, ou signal SIGUSR1 (kill -USR1 <pid>).
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+DOSSIER_TRACES = "traces"
+
+
+class TamponTraces:
+    """Garde les derniers intervalles mesurés (les plus anciens sont écrasés)"""
+
+    def __init__(self, capacite=20000):
+        self.actif = True
+        self._intervalles = deque(maxlen=capacite)  # append atomique : utilisable depuis les tâches de fond
+        self._origine = time.perf_counter()
+
+    def ajouter(self, nom, categorie, debut, fin, arguments=None):
+        """Enregistre un intervalle [debut, fin] (secondes perf_counter)"""
+        if self.actif:
+            self._intervalles.append((nom, categorie, debut, fin, threading.get_ident(), arguments))
+
+    @contextmanager
+    def intervalle(self, nom, categorie, arguments=None):
+        """Mesure le bloc `with` (rien n'est mesuré si le tampon est inactif)"""
+        if not self.actif:
+            yield
+            return
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.ajouter(nom, categorie, debut, time.perf_counter(), arguments)
+
+    def vider(self):
+        self._intervalles.clear()
+
+    def evenements_chrome(self):
+        """Intervalles au format Trace Event (événements complets « X », en µs)"""
+        pid = os.getpid()
+        evenements = []
+        for nom, categorie, debut, fin, tid, arguments in list(self._intervalles):
+            evenement = {
+                "name": nom,
+                "cat": categorie,
+                "ph": "X",
+                "ts": round((debut - self._origine) * 1e6, 1),
+                "dur": round((fin - debut) * 1e6, 1),
+                "pid": pid,
+                "tid": tid,
+            }
+            if arguments:
+                evenement["args"] = arguments
+            evenements.append(evenement)
+        return evenements
+
+    def exporter(self, chemin=None):
+        """Écrit le tampon dans un fichier JSON Chrome ; retourne son chemin"""
+        if chemin is None:
+            os.makedirs(DOSSIER_TRACES, exist_ok=True)
+            chemin = os.path.join(DOSSIER_TRACES, time.strftime("boulange-%Y%m%d-%H%M%S.json"))
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            json.dump({"traceEvents": self.evenements_chrome(), "displayTimeUnit": "ms"}, fichier)
+        print(f"Traces exportées : {chemin}")
+        return chemin
+
+
+# Instance partagée par la boucle, les écrans et le gestionnaire d'images
+tampon_traces = TamponTraces()
+
+
+def tracer(nom, categorie, arguments=None):
+    """Fonction utilitaire : `with tracer(...)` mesure un bloc dans le tampon partagé"""
+    return tampon_traces.intervalle(nom, categorie, arguments)
+
+
+def installer_signal_export():
+    """Exporte les traces à la réception de SIGUSR1 (si la plateforme le permet)"""
+    if not hasattr(signal, "SIGUSR1") or threading.current_thread() is not threading.main_thread():
+        return False
+    signal.signal(signal.SIGUSR1, lambda signum, frame: tampon_traces.exporter())
+    return True
@@ -6,20 +6,411 @@ Contient les boutons, zones de texte et autres éléments graphiques
 """
 
 import pygame
-import os
+from collections import OrderedDict
+from assets import charger_image
+from polices import obtenir_police
 
-class Bouton:
+
+class CacheTextes:
+    """Cache LRU des textes déjà rendus, indexé par (police, texte, antialias, couleur)"""
+
+    def __init__(self, capacite=512):
+        self.capacite = capacite
+        self.succes = 0
+        self.echecs = 0
+        self._cache = OrderedDict()
+
+    def rendre(self, police, texte, antialias, couleur):
+        """Équivalent de police.render(...), sans re-rastériser un texte déjà vu"""
+        cle = (police, texte, antialias, tuple(couleur))
+        surface = self._cache.get(cle)
+        if surface is not None:
+            self._cache.move_to_end(cle)
+            self.succes += 1
+            return surface
+
+        self.echecs += 1
+        surface = police.render(texte, antialias, couleur)
+        self._cache[cle] = surface
+        if len(self._cache) > self.capacite:
+            self._cache.popitem(last=False)
+        return surface
+
+    def vider(self):
+        """Vide le cache (les compteurs sont conservés)"""
+        self._cache.clear()
+
+    def statistiques(self):
+        """Retourne les compteurs du cache (succès, échecs, taux, entrées)"""
+        total = self.succes + self.echecs
+        return {
+            "succes": self.succes,
+            "echecs": self.echecs,
+            "taux_succes": self.succes / total if total else 0.0,
+            "entrees": len(self._cache),
+            "capacite": self.capacite,
+        }
+
+
+# Instance partagée par tous les composants et écrans
+cache_textes = CacheTextes()
+
+
+def rendre_texte(police, texte, antialias, couleur):
+    """Fonction utilitaire : rendu d'un texte via le cache partagé"""
+    return cache_textes.rendre(police, texte, antialias, couleur)
+
+
+class ZonesModifiees:
+    """Régions de l'écran à redessiner à la prochaine image (rendu partiel)"""
+
+    def __init__(self):
+        self.rects = []
+        self.tout_redessiner = True
+
+    def ajouter(self, rect):
+        """Signale une région modifiée"""
+        if not self.tout_redessiner:
+            self.rects.append(pygame.Rect(rect))
+
+    def tout(self):
+        """Demande un rendu complet (changement d'écran, fenêtre modale, etc.)"""
+        self.tout_redessiner = True
+        self.rects.clear()
+
+    def recuperer(self):
+        """Retourne (tout_redessiner, rects) puis remet à zéro pour l'image suivante"""
+        resultat = (self.tout_redessiner, self.rects)
+        self.tout_redessiner = False
+        self.rects = []
+        return resultat
+
+
+# Instance partagée : les composants y signalent leurs changements d'état
+zones_modifiees = ZonesModifiees()
+
+
+def signaler_zone(rect):
+    """Fonction utilitaire : signale une région modifiée"""
+    zones_modifiees.ajouter(rect)
+
+
+class CoucheStatique:
+    """
+    Partie fixe d'un écran (fond, titres, décor), rastérisée une seule fois
+    dans une surface en cache puis recopiée d'un seul blit.
+    La couche est recalculée si la taille de l'écran ou la clé de contenu change.
+    """
+
+    def __init__(self, dessiner, couleur_fond=None):
+        self._dessiner = dessiner        # fonction(surface) qui dessine la partie fixe
+        self.couleur_fond = couleur_fond  # None = couche transparente
+        self._surface = None
+        self._cle = None
+
+    def invalider(self):
+        """Force un nouveau rendu de la couche à la prochaine image"""
+        self._surface = None
+
+    def dessiner(self, surface, cle=None):
+        """Recopie la couche sur `surface` ; `cle` identifie le contenu (ex. la recette)"""
+        taille = surface.get_size()
+        if self._surface is None or self._surface.get_size() != taille or cle != self._cle:
+            self._surface = self._rasteriser(taille)
+            self._cle = cle
+        surface.blit(self._surface, (0, 0))
+
+    def _rasteriser(self, taille):
+        affichage = pygame.display.get_surface() is not None
+        if self.couleur_fond is None:
+            couche = pygame.Surface(taille, pygame.SRCALPHA)
+            couche = couche.convert_alpha() if affichage else couche
+            couche.fill((0, 0, 0, 0))
+        else:
+            couche = pygame.Surface(taille)
+            couche = couche.convert() if affichage else couche
+            couche.fill(self.couleur_fond)
+        self._dessiner(couche)
+        return couche
+
+
+# Voile sombre des fenêtres modales, alloué une fois par taille d'écran
+_voiles_modaux = {}
+
+
+def _voile_modal(taille):
+    voile = _voiles_modaux.get(taille)
+    if voile is None:
+        voile = pygame.Surface(taille)
+        voile.fill((0, 0, 0))
+        voile.set_alpha(128)
+        _voiles_modaux[taille] = voile
+    return voile
+
+
+class Widget:
+    """
+    Élément d'interface en mode retenu.
+    Son rendu est gardé en cache (coordonnées locales) et n'est refait qu'après
+    invalider(), appelé quand un état affiché change (survol, sélection, valeur...).
+    """
+
+    def __init__(self, x, y, largeur, hauteur):
+        self.rect = pygame.Rect(x, y, largeur, hauteur)
+        self._rendu = None
+        self._index_parent = None  # GrilleSpatiale du conteneur, s'il y en a un
+
+    def invalider(self):
+        """L'état affiché a changé : rendu à refaire et zone à redessiner"""
+        self._rendu = None
+        signaler_zone(self.rect)
+
+    def deplacer(self, position):
+        """Déplace le widget (coin haut-gauche) ; son rendu en cache reste valable"""
+        signaler_zone(self.rect)
+        self.rect.topleft = position
+        signaler_zone(self.rect)
+        if self._index_parent is not None:
+            self._index_parent.mettre_a_jour(self)
+
+    def rendre(self, surface):
+        """Dessine le widget dans `surface`, de la taille de self.rect (à redéfinir)"""
+        raise NotImplementedError
+
+    def gerer_evenement(self, evenement):
+        """Retourne True si le widget a consommé l'événement"""
+        return False
+
+    def dessiner(self, surface):
+        """Recopie le rendu en cache (le refait s'il a été invalidé)"""
+        if self._rendu is None:
+            rendu = pygame.Surface(self.rect.size)
+            if pygame.display.get_surface() is not None:
+                rendu = rendu.convert()
+            self.rendre(rendu)
+            self._rendu = rendu
+        surface.blit(self._rendu, self.rect)
+
+
+class GrilleSpatiale:
+    """
+    Index en grille uniforme des rectangles des widgets.
+    Un point ne se teste que contre les widgets de sa cellule : O(1) en moyenne,
+    quel que soit le nombre de widgets.
+    """
+
+    def __init__(self, taille_cellule=64):
+        self.taille_cellule = taille_cellule
+        self._cellules = {}   # (colonne, ligne) -> [widgets]
+        self._places = {}     # widget -> cellules occupées
+        self._ordre = {}      # widget -> rang d'ajout (le dernier ajouté est dessus)
+        self._compteur = 0
+
+    def _cellules_de(self, rect):
+        t = self.taille_cellule
+        return [
+            (colonne, ligne)
+            for colonne in range(rect.left // t, (rect.right - 1) // t + 1)
+            for ligne in range(rect.top // t, (rect.bottom - 1) // t + 1)
+        ]
+
+    def ajouter(self, widget):
+        self._compteur += 1
+        self._ordre[widget] = self._compteur
+        self._indexer(widget)
+        widget._index_parent = self
+
+    def retirer(self, widget):
+        self._desindexer(widget)
+        self._ordre.pop(widget, None)
+        widget._index_parent = None
+
+    def mettre_a_jour(self, widget):
+        """À appeler quand le rectangle du widget a changé"""
+        self._desindexer(widget)
+        self._indexer(widget)
+
+    def _indexer(self, widget):
+        cellules = self._cellules_de(widget.rect)
+        for cellule in cellules:
+            self._cellules.setdefault(cellule, []).append(widget)
+        self._places[widget] = cellules
+
+    def _desindexer(self, widget):
+        for cellule in self._places.pop(widget, []):
+            occupants = self._cellules[cellule]
+            occupants.remove(widget)
+            if not occupants:
+                del self._cellules[cellule]
+
+    def widget_en(self, position):
+        """Widget sous `position` (le plus haut s'ils se chevauchent), ou None"""
+        t = self.taille_cellule
+        cible = None
+        for widget in self._cellules.get((position[0] // t, position[1] // t), ()):
+            if widget.rect.collidepoint(position):
+                if cible is None or self._ordre[widget] > self._ordre[cible]:
+                    cible = widget
+        return cible
+
+
+# Événements routés vers le seul widget sous la souris
+_EVENEMENTS_POSITIONNELS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+
+
+def accepte_evenement(destinataire, evenement):
+    """
+    Vrai si l'écran ou le widget s'est abonné à ce type d'événement
+    (attribut evenements_acceptes ; sans cet attribut, il reçoit tout).
+    """
+    acceptes = getattr(destinataire, "evenements_acceptes", None)
+    return acceptes is None or evenement.type in acceptes
+
+
+def fusionner_mouvements(evenements):
+    """
+    Remplace chaque suite de MOUSEMOTION consécutifs par un seul événement
+    à la dernière position (déplacements relatifs cumulés).
+    """
+    resultat = []
+    for evenement in evenements:
+        precedent = resultat[-1] if resultat else None
+        if (
+            evenement.type == pygame.MOUSEMOTION
+            and precedent is not None
+            and precedent.type == pygame.MOUSEMOTION
+        ):
+            attributs = dict(evenement.dict)
+            attributs["rel"] = (
+                precedent.rel[0] + evenement.rel[0],
+                precedent.rel[1] + evenement.rel[1],
+            )
+            resultat[-1] = pygame.event.Event(pygame.MOUSEMOTION, attributs)
+        else:
+            resultat.append(evenement)
+    return resultat
+
+
+class Conteneur:
+    """
+    Groupe de widgets dessinés et notifiés ensemble.
+    Seuls les enfants qui touchent la zone de clip de la surface sont recomposés,
+    ce qui, avec le rendu partiel, limite le travail aux widgets modifiés.
+    Les événements souris sont routés par une GrilleSpatiale vers le seul widget visé.
+    """
+
+    def __init__(self, enfants=None):
+        self.enfants = []
+        self.index = GrilleSpatiale()
+        self._survole = None  # dernier enfant sous la souris
+        for enfant in enfants or []:
+            self.ajouter(enfant)
+
+    def ajouter(self, enfant):
+        self.enfants.append(enfant)
+        self.index.ajouter(enfant)
+        return enfant
+
+    def retirer(self, enfant):
+        self.enfants.remove(enfant)
+        self.index.retirer(enfant)
+        if self._survole is enfant:
+            self._survole = None
+
+    def oublier_survol(self):
+        """Efface le survol (écran quitté puis rouvert : la souris a pu bouger entre-temps)"""
+        for enfant in self.enfants:
+            if getattr(enfant, "survole", False):
+                enfant.survole = False
+        self._survole = None
+
+    @property
+    def rect(self):
+        if not self.enfants:
+            return pygame.Rect(0, 0, 0, 0)
+        return self.enfants[0].rect.unionall([enfant.rect for enfant in self.enfants[1:]])
+
+    def gerer_evenement(self, evenement):
+        """Transmet l'événement aux enfants ; retourne celui qui l'a consommé (ou None)"""
+        if evenement.type in _EVENEMENTS_POSITIONNELS:
+            cible = self.index.widget_en(evenement.pos)
+            if evenement.type == pygame.MOUSEMOTION:
+                # L'ancien widget survolé doit aussi apprendre que la souris l'a quitté
+                if self._survole is not None and self._survole is not cible:
+                    self._survole.gerer_evenement(evenement)
+                self._survole = cible
+            if cible is not None and cible.gerer_evenement(evenement):
+                return cible
+            return None
+
+        for enfant in self.enfants:
+            if accepte_evenement(enfant, evenement) and enfant.gerer_evenement(evenement):
+                return enfant
+        return None
+
+    def dessiner(self, surface):
+        clip = surface.get_clip()
+        for enfant in self.enfants:
+            if enfant.rect.colliderect(clip):
+                enfant.dessiner(surface)
+
+
+class Etiquette(Widget):
+    """Texte sur un fond uni, éventuellement encadré"""
+
+    def __init__(self, x, y, largeur, hauteur, texte, police, couleur_texte,
+                 couleur_fond=(255, 255, 255), bordure=0, centre=None):
+        super().__init__(x, y, largeur, hauteur)
+        self._texte = texte
+        self.police = police
+        self.couleur_texte = couleur_texte
+        self.couleur_fond = couleur_fond
+        self.bordure = bordure
+        self.centre = centre  # centre du texte en coordonnées locales (défaut : centre du widget)
+
+    @property
+    def texte(self):
+        return self._texte
+
+    @texte.setter
+    def texte(self, valeur):
+        if valeur != self._texte:
+            self._texte = valeur
+            self.invalider()
+
+    def rendre(self, surface):
+        local = surface.get_rect()
+        surface.fill(self.couleur_fond)
+        if self.bordure:
+            pygame.draw.rect(surface, (0, 0, 0), local, self.bordure)
+        texte_surface = rendre_texte(self.police, self._texte, True, self.couleur_texte)
+        surface.blit(texte_surface, texte_surface.get_rect(center=self.centre or local.center))
+
+
+class Bouton(Widget):
     """Classe pour créer des boutons interactifs"""
+
+    evenements_acceptes = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
     
     def __init__(self, x, y, largeur, hauteur, texte, couleur_fond, couleur_texte, police):
-        self.rect = pygame.Rect(x, y, largeur, hauteur)
+        super().__init__(x, y, largeur, hauteur)
         self.texte = texte
         self.couleur_fond = couleur_fond
         self.couleur_fond_survol = tuple(min(255, c + 30) for c in couleur_fond)
         self.couleur_texte = couleur_texte
         self.police = police
-        self.survole = False
+        self._survole = False
         self.clique = False
+
+    @property
+    def survole(self):
+        return self._survole
+
+    @survole.setter
+    def survole(self, valeur):
+        if valeur != self._survole:
+            self._survole = valeur
+            self.invalider()
     
     def gerer_evenement(self, evenement):
         """Gère les événements de souris pour le bouton"""
@@ -33,38 +424,58 @@ class Bouton:
             self.clique = False
         return False
     
-    def dessiner(self, surface):
-        """Dessine le bouton sur la surface"""
+    def rendre(self, surface):
+        """Dessine le bouton (coordonnées locales)"""
+        local = surface.get_rect()
         couleur = self.couleur_fond_survol if self.survole else self.couleur_fond
-        pygame.draw.rect(surface, couleur, self.rect)
-        pygame.draw.rect(surface, (0, 0, 0), self.rect, 2)
+        pygame.draw.rect(surface, couleur, local)
+        pygame.draw.rect(surface, (0, 0, 0), local, 2)
         
         # Rendu du texte centré
-        texte_surface = self.police.render(self.texte, True, self.couleur_texte)
-        texte_rect = texte_surface.get_rect(center=self.rect.center)
+        texte_surface = rendre_texte(self.police, self.texte, True, self.couleur_texte)
+        texte_rect = texte_surface.get_rect(center=local.center)
         surface.blit(texte_surface, texte_rect)
 
-class BoutonImage:
+class BoutonImage(Widget):
     """Bouton avec image et texte"""
+
+    evenements_acceptes = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN})
     
     def __init__(self, x, y, largeur, hauteur, texte, chemin_image, police):
-        self.rect = pygame.Rect(x, y, largeur, hauteur)
+        super().__init__(x, y, largeur, hauteur)
         self.texte = texte
         self.police = police
-        self.survole = False
-        self.selectionne = False
+        self._survole = False
+        self._selectionne = False
         
         # Chargement de l'image (avec fallback)
         self.image = self._charger_image(chemin_image, (largeur - 20, hauteur - 50))
+
+    @property
+    def survole(self):
+        return self._survole
+
+    @survole.setter
+    def survole(self, valeur):
+        if valeur != self._survole:
+            self._survole = valeur
+            self.invalider()
+
+    @property
+    def selectionne(self):
+        return self._selectionne
+
+    @selectionne.setter
+    def selectionne(self, valeur):
+        if valeur != self._selectionne:
+            self._selectionne = valeur
+            self.invalider()
     
     def _charger_image(self, chemin, taille):
         """Charge une image avec fallback vers un placeholder"""
-        try:
-            if os.path.exists(chemin):
-                image = pygame.image.load(chemin)
-                return pygame.transform.scale(image, taille)
-        except:
-            pass
+        image = charger_image(chemin, taille)
+        if image is not None:
+            return image
         
         # Création d'un placeholder coloré
         placeholder = pygame.Surface(taille)
@@ -97,53 +508,79 @@ class BoutonImage:
                 return True
         return False
     
-    def dessiner(self, surface):
-        """Dessine le bouton image"""
+    def rendre(self, surface):
+        """Dessine le bouton image (coordonnées locales)"""
+        local = surface.get_rect()
+
         # Fond du bouton
         couleur_fond = (255, 255, 255) if not self.survole else (240, 240, 240)
         if self.selectionne:
             couleur_fond = (200, 255, 200)  # Vert clair si sélectionné
         
-        pygame.draw.rect(surface, couleur_fond, self.rect)
-        pygame.draw.rect(surface, (0, 0, 0), self.rect, 2)
+        pygame.draw.rect(surface, couleur_fond, local)
+        pygame.draw.rect(surface, (0, 0, 0), local, 2)
         
         # Image
         image_rect = self.image.get_rect()
-        image_rect.centerx = self.rect.centerx
-        image_rect.y = self.rect.y + 10
+        image_rect.centerx = local.centerx
+        image_rect.y = 10
         surface.blit(self.image, image_rect)
         
         # Texte en bas
-        texte_surface = self.police.render(self.texte, True, (0, 0, 0))
+        texte_surface = rendre_texte(self.police, self.texte, True, (0, 0, 0))
         texte_rect = texte_surface.get_rect()
-        texte_rect.centerx = self.rect.centerx
-        texte_rect.bottom = self.rect.bottom - 10
+        texte_rect.centerx = local.centerx
+        texte_rect.bottom = local.bottom - 10
         surface.blit(texte_surface, texte_rect)
         
         # Checkmark si sélectionné
         if self.selectionne:
             checkmark = "✓"
-            check_surface = pygame.font.Font(None, 36).render(checkmark, True, (0, 150, 0))
+            check_surface = rendre_texte(obtenir_police(None, 36), checkmark, True, (0, 150, 0))
             check_rect = check_surface.get_rect()
-            check_rect.topright = (self.rect.right - 5, self.rect.top + 5)
+            check_rect.topright = (local.right - 5, 5)
             surface.blit(check_surface, check_rect)
 
-class Compteur:
+class Compteur(Conteneur):
     """Composant pour afficher et modifier des valeurs numériques"""
+
+    evenements_acceptes = Bouton.evenements_acceptes
     
     def __init__(self, x, y, valeur_initiale, valeur_min, valeur_max, pas, unite, police):
+        super().__init__()
         self.x = x
         self.y = y
-        self.valeur = valeur_initiale
+        self._valeur = valeur_initiale
         self.valeur_min = valeur_min
         self.valeur_max = valeur_max
         self.pas = pas
         self.unite = unite
         self.police = police
         
-        # Boutons + et -
-        self.bouton_moins = Bouton(x - 30, y, 25, 30, "-", (255, 200, 200), (0, 0, 0), police)
-        self.bouton_plus = Bouton(x + 120, y, 25, 30, "+", (200, 255, 200), (0, 0, 0), police)
+        # Boutons + et -, valeur au centre
+        self.bouton_moins = self.ajouter(Bouton(x - 30, y, 25, 30, "-", (255, 200, 200), (0, 0, 0), police))
+        self.bouton_plus = self.ajouter(Bouton(x + 120, y, 25, 30, "+", (200, 255, 200), (0, 0, 0), police))
+        self.etiquette = self.ajouter(Etiquette(
+            x - 5, y, 115, 30, self._texte_valeur(), police, (0, 0, 0),
+            bordure=1, centre=(50, 15),
+        ))
+
+    @property
+    def valeur(self):
+        return self._valeur
+
+    @valeur.setter
+    def valeur(self, valeur):
+        if valeur != self._valeur:
+            self._valeur = valeur
+            self.etiquette.texte = self._texte_valeur()
+
+    def _texte_valeur(self):
+        return f"{self._valeur} {self.unite}"
+
+    def rect_valeur(self):
+        """Zone où la valeur est affichée"""
+        return self.etiquette.rect
     
     def gerer_evenement(self, evenement):
         """Gère les événements pour le compteur"""
@@ -156,28 +593,10 @@ class Compteur:
                 self.valeur += self.pas
                 return True
         return False
-    
-    def dessiner(self, surface):
-        """Dessine le compteur"""
-        self.bouton_moins.dessiner(surface)
-        self.bouton_plus.dessiner(surface)
-        
-        # Valeur au centre
-        texte = f"{self.valeur} {self.unite}"
-        texte_surface = self.police.render(texte, True, (0, 0, 0))
-        texte_rect = texte_surface.get_rect()
-        texte_rect.center = (self.x + 45, self.y + 15)
-        
-        # Fond pour le texte
-        fond_rect = pygame.Rect(self.x - 5, self.y, 115, 30)
-        pygame.draw.rect(surface, (255, 255, 255), fond_rect)
-        pygame.draw.rect(surface, (0, 0, 0), fond_rect, 1)
-        
-        surface.blit(texte_surface, texte_rect)
 
 def dessiner_texte_centre(surface, texte, y, police, couleur):
     """Fonction utilitaire pour dessiner du texte centré"""
-    texte_surface = police.render(texte, True, couleur)
+    texte_surface = rendre_texte(police, texte, True, couleur)
     texte_rect = texte_surface.get_rect()
     texte_rect.centerx = surface.get_width() // 2
     texte_rect.y = y
@@ -186,11 +605,8 @@ def dessiner_texte_centre(surface, texte, y, police, couleur):
 
 def dessiner_fenetre_modale(surface, largeur, hauteur, titre, contenu, police_titre, police_contenu):
     """Dessine une fenêtre modale au centre de l'écran"""
-    # Fond semi-transparent
-    overlay = pygame.Surface((surface.get_width(), surface.get_height()))
-    overlay.set_alpha(128)
-    overlay.fill((0, 0, 0))
-    surface.blit(overlay, (0, 0))
+    # Fond semi-transparent (surface réutilisée d'une image à l'autre)
+    surface.blit(_voile_modal(surface.get_size()), (0, 0))
     
     # Fenêtre modale
     modal_rect = pygame.Rect(
@@ -203,7 +619,7 @@ def dessiner_fenetre_modale(surface, largeur, hauteur, titre, contenu, police_ti
     pygame.draw.rect(surface, (0, 0, 0), modal_rect, 3)
     
     # Titre
-    titre_surface = police_titre.render(titre, True, (0, 0, 0))
+    titre_surface = rendre_texte(police_titre, titre, True, (0, 0, 0))
     titre_rect = titre_surface.get_rect()
     titre_rect.centerx = modal_rect.centerx
     titre_rect.y = modal_rect.y + 20
@@ -212,7 +628,7 @@ def dessiner_fenetre_modale(surface, largeur, hauteur, titre, contenu, police_ti
     # Contenu (ligne par ligne)
     y_offset = titre_rect.bottom + 30
     for ligne in contenu:
-        ligne_surface = police_contenu.render(ligne, True, (0, 0, 0))
+        ligne_surface = rendre_texte(police_contenu, ligne, True, (0, 0, 0))
         ligne_rect = ligne_surface.get_rect()
         ligne_rect.centerx = modal_rect.centerx
         ligne_rect.y = y_offset